@@ -2,12 +2,13 @@
 
 from typing import List, Optional
 
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
 from sqlalchemy import select, func
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.db.base import get_db
 from app.models.alert import Alert
+from app.schemas.base import Severity
 from app.schemas.alert import AlertCreate, AlertUpdate, AlertResponse, AlertListResponse
 
 router = APIRouter()
@@ -17,7 +18,7 @@ router = APIRouter()
 async def list_alerts(
     page: int = Query(1, ge=1, description="Page number"),
     page_size: int = Query(25, ge=1, le=100, description="Items per page"),
-    severity: Optional[str] = Query(None, description="Filter by severity"),
+    severity: Optional[Severity] = Query(None, description="Filter by severity"),
     status: Optional[str] = Query(None, description="Filter by status"),
     source: Optional[str] = Query(None, description="Filter by source"),
     db: AsyncSession = Depends(get_db),
@@ -63,7 +64,7 @@ async def list_alerts(
     # Calculate total pages
     pages = (total + page_size - 1) // page_size
 
-    return AlertListResponse(
+    page_data = AlertListResponse(
         items=alerts,
         total=total,
         page=page,
@@ -71,6 +72,10 @@ async def list_alerts(
         pages=pages
     )
 
+    # Already validated above; serialize once in pydantic-core instead of
+    # letting FastAPI re-validate the model and encode it again
+    return Response(content=page_data.model_dump_json(), media_type="application/json")
+
 
 @router.get("/{alert_id}", response_model=AlertResponse)
 async def get_alert(
@@ -214,9 +219,9 @@ async def acknowledge_alert(
             detail=f"Alert with ID {alert_id} not found"
         )
 
-    from datetime import datetime
+    from datetime import datetime, timezone
     alert.status = "acknowledged"
-    alert.acknowledged_at = datetime.utcnow()
+    alert.acknowledged_at = datetime.now(timezone.utc)
 
     await db.commit()
     await db.refresh(alert)
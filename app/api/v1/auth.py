@@ -1,6 +1,6 @@
 """Authentication API endpoints."""
 
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 from typing import Annotated
 
 from fastapi import APIRouter, Depends, HTTPException, status
@@ -14,7 +14,7 @@ from app.core.security import (
     create_refresh_token,
     decode_token,
     get_password_hash,
-    verify_password,
+    verify_and_update_password,
 )
 from app.db.base import get_db
 from app.models.user import User
@@ -137,7 +137,6 @@ async def register(
         hashed_password=hashed_password,
         is_active=True,
         is_superuser=False,
-        created_at=datetime.utcnow()
     )
 
     db.add(user)
@@ -171,7 +170,11 @@ async def login(
     user = result.scalar_one_or_none()
 
     # Verify password
-    if not user or not verify_password(form_data.password, user.hashed_password):
+    verified, new_hash = (
+        verify_and_update_password(form_data.password, user.hashed_password)
+        if user else (False, None)
+    )
+    if not verified:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Incorrect username or password",
@@ -185,8 +188,12 @@ async def login(
             detail="Inactive user"
         )
 
+    # Upgrade legacy bcrypt hashes to Argon2id transparently
+    if new_hash:
+        user.hashed_password = new_hash
+
     # Update last login
-    user.last_login = datetime.utcnow()
+    user.last_login = datetime.now(timezone.utc)
     await db.commit()
 
     # Create tokens
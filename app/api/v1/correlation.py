@@ -184,9 +184,9 @@ async def get_correlation_statistics(
     """
     Get alert correlation and deduplication statistics.
     """
-    from datetime import datetime, timedelta
+    from datetime import datetime, timedelta, timezone
 
-    start_time = datetime.utcnow() - timedelta(hours=time_range_hours)
+    start_time = datetime.now(timezone.utc) - timedelta(hours=time_range_hours)
 
     # Get total alerts
     total_query = select(Alert).where(Alert.created_at >= start_time)
@@ -1,6 +1,6 @@
 """Dashboard metrics and KPI endpoints."""
 
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 from typing import Optional
 
 from fastapi import APIRouter, Depends, Query
@@ -29,7 +29,7 @@ async def get_dashboard_metrics(
     Returns:
         Dashboard metrics including alert counts, incident stats, and trends
     """
-    now = datetime.utcnow()
+    now = datetime.now(timezone.utc)
     start_time = now - timedelta(hours=time_range)
 
     # Alert metrics
@@ -165,7 +165,7 @@ async def get_alert_trend(
     Returns:
         Time-series alert trend data
     """
-    now = datetime.utcnow()
+    now = datetime.now(timezone.utc)
     start_time = now - timedelta(hours=hours)
 
     # Generate time buckets
@@ -212,7 +212,7 @@ async def get_threat_map(
     Returns:
         Geographic threat data for visualization
     """
-    now = datetime.utcnow()
+    now = datetime.now(timezone.utc)
     start_time = now - timedelta(hours=hours)
 
     # This would typically extract IP addresses from alerts and geolocate them
@@ -2,12 +2,15 @@
 Detection Rule Management API
 """
 from typing import Optional
-from fastapi import APIRouter, Depends, HTTPException, Query, status
-from sqlalchemy import select, func
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
+from sqlalchemy import Text, cast, func, literal_column, select
+from sqlalchemy.dialects.postgresql import aggregate_order_by
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import load_only
 
 from app.db.base import get_db
 from app.models.detection_rule import DetectionRule, RuleTuning
+from app.schemas.base import Severity
 from app.schemas.detection_rule import (
     DetectionRuleCreate,
     DetectionRuleUpdate,
@@ -21,6 +24,16 @@ from app.models.user import User
 
 router = APIRouter(prefix="/detection-rules", tags=["Detection Rules"])
 
+# Columns backing DetectionRuleResponse (everything except changelog)
+RESPONSE_COLUMNS = [
+    getattr(DetectionRule, name) for name in DetectionRuleResponse.model_fields
+]
+
+
+def _json_key(name: str):
+    """Inline a JSON object key; jsonb_build_object cannot infer bind param types."""
+    return literal_column(f"'{name}'")
+
 
 @router.get("/", response_model=DetectionRuleListResponse)
 async def list_detection_rules(
@@ -28,54 +41,65 @@ async def list_detection_rules(
     page_size: int = Query(25, ge=1, le=100),
     rule_type: Optional[str] = Query(None),
     category: Optional[str] = Query(None),
-    severity: Optional[str] = Query(None),
+    severity: Optional[Severity] = Query(None),
     is_enabled: Optional[bool] = Query(None),
     is_validated: Optional[bool] = Query(None),
     db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_active_user),
 ):
-    """List all detection rules with pagination and filtering."""
-    query = select(DetectionRule)
+    """List all detection rules with pagination and filtering.
 
+    The page is serialized by Postgres as a single JSON document, so rows are
+    never hydrated into ORM objects or re-validated by Pydantic.
+    """
+    filters = []
     if rule_type:
-        query = query.where(DetectionRule.rule_type == rule_type)
+        filters.append(DetectionRule.rule_type == rule_type)
     if category:
-        query = query.where(DetectionRule.category == category)
+        filters.append(DetectionRule.category == category)
     if severity:
-        query = query.where(DetectionRule.severity == severity)
+        filters.append(DetectionRule.severity == severity)
     if is_enabled is not None:
-        query = query.where(DetectionRule.is_enabled == is_enabled)
+        filters.append(DetectionRule.is_enabled == is_enabled)
     if is_validated is not None:
-        query = query.where(DetectionRule.is_validated == is_validated)
+        filters.append(DetectionRule.is_validated == is_validated)
 
-    # Get total count
-    count_query = select(func.count()).select_from(DetectionRule)
-    if rule_type:
-        count_query = count_query.where(DetectionRule.rule_type == rule_type)
-    if category:
-        count_query = count_query.where(DetectionRule.category == category)
-    if severity:
-        count_query = count_query.where(DetectionRule.severity == severity)
-    if is_enabled is not None:
-        count_query = count_query.where(DetectionRule.is_enabled == is_enabled)
-    if is_validated is not None:
-        count_query = count_query.where(DetectionRule.is_validated == is_validated)
+    total = (
+        select(func.count())
+        .select_from(DetectionRule)
+        .where(*filters)
+        .scalar_subquery()
+    )
 
-    count_result = await db.execute(count_query)
-    total = count_result.scalar()
+    page_rows = (
+        select(*RESPONSE_COLUMNS)
+        .where(*filters)
+        .order_by(DetectionRule.id)
+        .offset((page - 1) * page_size)
+        .limit(page_size)
+        .subquery()
+    )
 
-    # Pagination
-    query = query.offset((page - 1) * page_size).limit(page_size)
-    result = await db.execute(query)
-    rules = result.scalars().all()
+    rule_object = func.jsonb_build_object(
+        *(arg for column in page_rows.c for arg in (_json_key(column.name), column))
+    )
+    rules = func.coalesce(
+        select(func.jsonb_agg(aggregate_order_by(rule_object, page_rows.c.id)))
+        .scalar_subquery(),
+        literal_column("'[]'::jsonb")
+    )
 
-    return DetectionRuleListResponse(
-        total=total,
-        page=page,
-        page_size=page_size,
-        rules=rules
+    body = func.jsonb_build_object(
+        _json_key("total"), total,
+        _json_key("page"), page,
+        _json_key("page_size"), page_size,
+        _json_key("rules"), rules,
     )
 
+    result = await db.execute(select(cast(body, Text)))
+
+    return Response(content=result.scalar_one(), media_type="application/json")
+
 
 @router.get("/{rule_id}", response_model=DetectionRuleResponse)
 async def get_detection_rule(
@@ -84,7 +108,11 @@ async def get_detection_rule(
     current_user: User = Depends(get_current_active_user),
 ):
     """Get detection rule by ID."""
-    query = select(DetectionRule).where(DetectionRule.id == rule_id)
+    query = (
+        select(DetectionRule)
+        .options(load_only(*RESPONSE_COLUMNS))
+        .where(DetectionRule.id == rule_id)
+    )
     result = await db.execute(query)
     rule = result.scalar_one_or_none()
 
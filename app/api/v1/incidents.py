@@ -1,15 +1,16 @@
 """Incident API endpoints."""
 
-from datetime import datetime
+from datetime import datetime, timezone
 from typing import Optional
 
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
 from sqlalchemy import select, func
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.config import settings
 from app.db.base import get_db
 from app.models.incident import Incident, IncidentTimeline
+from app.schemas.base import IncidentStatus, Severity
 from app.schemas.incident import IncidentCreate, IncidentUpdate, IncidentResponse, IncidentListResponse
 
 router = APIRouter()
@@ -61,8 +62,8 @@ def calculate_sla_due_times(severity: str, created_at: datetime) -> tuple[dateti
 async def list_incidents(
     page: int = Query(1, ge=1, description="Page number"),
     page_size: int = Query(25, ge=1, le=100, description="Items per page"),
-    severity: Optional[str] = Query(None, description="Filter by severity"),
-    status: Optional[str] = Query(None, description="Filter by status"),
+    severity: Optional[Severity] = Query(None, description="Filter by severity"),
+    status: Optional[IncidentStatus] = Query(None, description="Filter by status"),
     assigned_analyst_id: Optional[int] = Query(None, description="Filter by assigned analyst"),
     db: AsyncSession = Depends(get_db),
 ):
@@ -107,14 +108,17 @@ async def list_incidents(
     # Calculate total pages
     pages = (total + page_size - 1) // page_size
 
-    return IncidentListResponse(
-        items=incidents,
+    # Rows come straight from the database, so skip per-row validation
+    page_data = IncidentListResponse.model_construct(
+        items=[IncidentResponse.from_orm_trusted(incident) for incident in incidents],
         total=total,
         page=page,
         page_size=page_size,
         pages=pages
     )
 
+    return Response(content=page_data.model_dump_json(), media_type="application/json")
+
 
 @router.get("/{incident_id}", response_model=IncidentResponse)
 async def get_incident(
@@ -162,7 +166,7 @@ async def create_incident(
     Returns:
         Created incident
     """
-    created_at = datetime.utcnow()
+    created_at = datetime.now(timezone.utc)
 
     # Generate ticket number
     ticket_number = generate_ticket_number()
@@ -192,8 +196,7 @@ async def create_incident(
         incident_id=incident.id,
         action_type="created",
         actor_type="system",
-        description=f"Incident {ticket_number} created",
-        created_at=created_at
+        description=f"Incident {ticket_number} created"
     )
     db.add(timeline_entry)
 
@@ -252,25 +255,24 @@ async def update_incident(
                 actor_type="system",
                 old_value={"value": str(values["old"])},
                 new_value={"value": str(values["new"])},
-                description=f"Updated {field} from {values['old']} to {values['new']}",
-                created_at=datetime.utcnow()
+                description=f"Updated {field} from {values['old']} to {values['new']}"
             )
             db.add(timeline_entry)
 
     # Check for status-specific timestamps
     if "status" in changes:
         if changes["status"]["new"] == "investigating" and not incident.first_response_at:
-            incident.first_response_at = datetime.utcnow()
+            incident.first_response_at = datetime.now(timezone.utc)
         elif changes["status"]["new"] == "contained" and not incident.containment_at:
-            incident.containment_at = datetime.utcnow()
+            incident.containment_at = datetime.now(timezone.utc)
         elif changes["status"]["new"] in ["recovered", "closed"] and not incident.resolution_at:
-            incident.resolution_at = datetime.utcnow()
+            incident.resolution_at = datetime.now(timezone.utc)
         elif changes["status"]["new"] == "closed":
-            incident.closed_at = datetime.utcnow()
+            incident.closed_at = datetime.now(timezone.utc)
 
     # Check SLA breach
     if incident.sla_first_response_due and not incident.first_response_at:
-        if datetime.utcnow() > incident.sla_first_response_due:
+        if datetime.now(timezone.utc) > incident.sla_first_response_due:
             incident.sla_breach = True
 
     await db.commit()
@@ -320,8 +322,7 @@ async def assign_incident(
         actor_type="system",
         old_value={"analyst_id": old_analyst} if old_analyst else None,
         new_value={"analyst_id": analyst_id},
-        description=f"Incident assigned to analyst {analyst_id}",
-        created_at=datetime.utcnow()
+        description=f"Incident assigned to analyst {analyst_id}"
     )
     db.add(timeline_entry)
 
@@ -382,8 +383,7 @@ async def escalate_incident(
             actor_type="system",
             old_value={"severity": old_severity},
             new_value={"severity": incident.severity},
-            description=f"Incident escalated from {old_severity} to {incident.severity}",
-            created_at=datetime.utcnow()
+            description=f"Incident escalated from {old_severity} to {incident.severity}"
         )
         db.add(timeline_entry)
 
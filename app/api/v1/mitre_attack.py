@@ -5,11 +5,12 @@ from typing import Optional
 from fastapi import APIRouter, Depends, HTTPException, Query
 from sqlalchemy import select, func
 from sqlalchemy.ext.asyncio import AsyncSession
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 
 from app.db.base import get_db
 from app.models.alert import Alert
 from app.models.incident import Incident
+from app.schemas.base import Severity
 from app.core.security import get_current_active_user
 from app.models.user import User
 
@@ -20,7 +21,7 @@ router = APIRouter(prefix="/mitre", tags=["MITRE ATT&CK"])
 @router.get("/navigator/layer")
 async def get_mitre_navigator_layer(
     time_range: int = Query(30, ge=1, le=365, description="Time range in days"),
-    severity: Optional[str] = Query(None, description="Filter by severity"),
+    severity: Optional[Severity] = Query(None, description="Filter by severity"),
     status: Optional[str] = Query(None, description="Filter by status"),
     db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_active_user),
@@ -30,7 +31,7 @@ async def get_mitre_navigator_layer(
 
     Returns a Layer 4.5 format JSON for visualization in ATT&CK Navigator.
     """
-    start_date = datetime.utcnow() - timedelta(days=time_range)
+    start_date = datetime.now(timezone.utc) - timedelta(days=time_range)
 
     # Query alerts for MITRE techniques
     query = select(Alert).where(Alert.created_at >= start_date)
@@ -90,7 +91,7 @@ async def get_mitre_navigator_layer(
             "layer": "4.5"
         },
         "domain": "enterprise-attack",
-        "description": f"MITRE ATT&CK coverage based on CoreRecon SOC detections from {start_date.strftime('%Y-%m-%d')} to {datetime.utcnow().strftime('%Y-%m-%d')}",
+        "description": f"MITRE ATT&CK coverage based on CoreRecon SOC detections from {start_date.strftime('%Y-%m-%d')} to {datetime.now(timezone.utc).strftime('%Y-%m-%d')}",
         "filters": {
             "platforms": ["windows", "linux", "macos", "network", "cloud"]
         },
@@ -116,7 +117,7 @@ async def get_mitre_navigator_layer(
             {"label": "Low Frequency", "color": "#ffe6e6"}
         ],
         "metadata": [
-            {"name": "Generated", "value": datetime.utcnow().isoformat()},
+            {"name": "Generated", "value": datetime.now(timezone.utc).isoformat()},
             {"name": "Total Alerts", "value": str(len(alerts))},
             {"name": "Unique Techniques", "value": str(len(technique_counts))},
             {"name": "Time Range", "value": f"{time_range} days"}
@@ -135,7 +136,7 @@ async def get_mitre_coverage_statistics(
     """
     Get MITRE ATT&CK coverage statistics.
     """
-    start_date = datetime.utcnow() - timedelta(days=time_range)
+    start_date = datetime.now(timezone.utc) - timedelta(days=time_range)
 
     # Get total alerts with MITRE mapping
     alert_query = select(func.count(Alert.id)).where(
@@ -218,7 +219,7 @@ async def get_alerts_by_technique(
     """
     Get all alerts associated with a specific MITRE ATT&CK technique.
     """
-    start_date = datetime.utcnow() - timedelta(days=time_range)
+    start_date = datetime.now(timezone.utc) - timedelta(days=time_range)
 
     # Query alerts containing the technique
     # Using JSONB contains operator
@@ -2,14 +2,15 @@
 Playbook Management and Execution API
 """
 from typing import Optional
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
 from sqlalchemy import select, func
 from sqlalchemy.ext.asyncio import AsyncSession
-from datetime import datetime
+from datetime import datetime, timezone
 
 from app.db.base import get_db
 from app.models.playbook import Playbook, PlaybookExecution
 from app.models.incident import Incident, IncidentTimeline
+from app.schemas.base import Severity
 from app.schemas.playbook import (
     PlaybookCreate,
     PlaybookUpdate,
@@ -32,7 +33,7 @@ async def list_playbooks(
     page: int = Query(1, ge=1),
     page_size: int = Query(25, ge=1, le=100),
     category: Optional[str] = Query(None),
-    severity: Optional[str] = Query(None),
+    severity: Optional[Severity] = Query(None),
     is_active: Optional[bool] = Query(None),
     db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_active_user),
@@ -64,13 +65,16 @@ async def list_playbooks(
     result = await db.execute(query)
     playbooks = result.scalars().all()
 
-    return PlaybookListResponse(
+    # Rows come straight from the database, so skip per-row validation
+    page_data = PlaybookListResponse.model_construct(
         total=total,
         page=page,
         page_size=page_size,
-        playbooks=playbooks
+        playbooks=[PlaybookResponse.from_orm_trusted(playbook) for playbook in playbooks]
     )
 
+    return Response(content=page_data.model_dump_json(), media_type="application/json")
+
 
 @router.get("/{playbook_id}", response_model=PlaybookResponse)
 async def get_playbook(
@@ -211,9 +215,9 @@ async def execute_playbook(
 
     # If no approval required, start immediately
     if not playbook.approval_required:
-        execution.started_at = datetime.utcnow()
+        execution.started_at = datetime.now(timezone.utc)
         execution.approved_by = current_user.id
-        execution.approved_at = datetime.utcnow()
+        execution.approved_at = datetime.now(timezone.utc)
 
     db.add(execution)
 
@@ -260,9 +264,9 @@ async def approve_playbook_execution(
 
     if approval.approve:
         execution.status = "running"
-        execution.started_at = datetime.utcnow()
+        execution.started_at = datetime.now(timezone.utc)
         execution.approved_by = current_user.id
-        execution.approved_at = datetime.utcnow()
+        execution.approved_at = datetime.now(timezone.utc)
     else:
         execution.status = "cancelled"
         execution.error_message = f"Rejected by {current_user.username}: {approval.comment or 'No reason provided'}"
@@ -298,7 +302,7 @@ async def update_playbook_execution(
 
     # Set completion timestamp if status is completed or failed
     if execution.status in ["completed", "failed", "cancelled"]:
-        execution.completed_at = datetime.utcnow()
+        execution.completed_at = datetime.now(timezone.utc)
         if execution.started_at:
             duration = (execution.completed_at - execution.started_at).total_seconds()
             execution.duration_seconds = int(duration)
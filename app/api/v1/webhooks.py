@@ -3,7 +3,7 @@
 import hashlib
 import hmac
 import logging
-from datetime import datetime
+from datetime import datetime, timezone
 from typing import Dict, Any
 
 from fastapi import APIRouter, Depends, HTTPException, Header, Request, status
@@ -195,7 +195,7 @@ def normalize_elastic_alert(payload: Dict[str, Any]) -> Dict[str, Any]:
         })
 
     return {
-        "alert_id": payload.get("alert_id", f"ELASTIC-{datetime.utcnow().timestamp()}"),
+        "alert_id": payload.get("alert_id", f"ELASTIC-{datetime.now(timezone.utc).timestamp()}"),
         "title": payload.get("rule_name", "Elastic SIEM Alert"),
         "description": payload.get("description"),
         "severity": severity,
@@ -207,7 +207,7 @@ def normalize_elastic_alert(payload: Dict[str, Any]) -> Dict[str, Any]:
         "affected_assets": {"items": affected_assets} if affected_assets else None,
         "mitre_tactics": {"items": mitre_tactics} if mitre_tactics else None,
         "mitre_techniques": {"items": mitre_techniques} if mitre_techniques else None,
-        "detected_at": datetime.fromisoformat(payload["timestamp"].replace("Z", "+00:00")) if payload.get("timestamp") else datetime.utcnow()
+        "detected_at": datetime.fromisoformat(payload["timestamp"].replace("Z", "+00:00")) if payload.get("timestamp") else datetime.now(timezone.utc)
     }
 
 
@@ -271,7 +271,7 @@ def normalize_sentinel_alert(payload: Dict[str, Any]) -> Dict[str, Any]:
     }
 
     return {
-        "alert_id": payload.get("SystemAlertId", f"SENTINEL-{datetime.utcnow().timestamp()}"),
+        "alert_id": payload.get("SystemAlertId", f"SENTINEL-{datetime.now(timezone.utc).timestamp()}"),
         "title": payload.get("AlertDisplayName", "Azure Sentinel Alert"),
         "description": payload.get("Description"),
         "severity": severity_map.get(payload.get("Severity"), "medium"),
@@ -279,7 +279,7 @@ def normalize_sentinel_alert(payload: Dict[str, Any]) -> Dict[str, Any]:
         "detection_rule_name": payload.get("AlertType"),
         "source_alert_id": payload.get("SystemAlertId"),
         "raw_event": payload,
-        "detected_at": datetime.fromisoformat(payload["TimeGenerated"].replace("Z", "+00:00")) if payload.get("TimeGenerated") else datetime.utcnow()
+        "detected_at": datetime.fromisoformat(payload["TimeGenerated"].replace("Z", "+00:00")) if payload.get("TimeGenerated") else datetime.now(timezone.utc)
     }
 
 
@@ -346,7 +346,7 @@ def normalize_splunk_alert(payload: Dict[str, Any]) -> Dict[str, Any]:
     result = payload.get("result", {})
 
     return {
-        "alert_id": payload.get("search_id", f"SPLUNK-{datetime.utcnow().timestamp()}"),
+        "alert_id": payload.get("search_id", f"SPLUNK-{datetime.now(timezone.utc).timestamp()}"),
         "title": payload.get("search_name", "Splunk Alert"),
         "description": result.get("description"),
         "severity": severity_map.get(payload.get("severity", "medium").lower(), "medium"),
@@ -354,5 +354,5 @@ def normalize_splunk_alert(payload: Dict[str, Any]) -> Dict[str, Any]:
         "detection_rule_name": payload.get("search_name"),
         "source_alert_id": payload.get("search_id"),
         "raw_event": payload,
-        "detected_at": datetime.utcnow()
+        "detected_at": datetime.now(timezone.utc)
     }
@@ -39,6 +39,8 @@ class Settings(BaseSettings):
     # Redis
     redis_url: str = Field(default="redis://localhost:6379/0", alias="REDIS_URL")
     redis_password: Optional[str] = Field(default=None, alias="REDIS_PASSWORD")
+    redis_max_connections: int = Field(default=32, alias="REDIS_MAX_CONNECTIONS")
+    redis_cluster: bool = Field(default=False, alias="REDIS_CLUSTER")
 
     # Elasticsearch
     elasticsearch_url: str = Field(
@@ -100,6 +102,16 @@ class Settings(BaseSettings):
         default=5000,
         alias="MAX_WEBSOCKET_CONNECTIONS"
     )
+    ws_batch_window_ms: int = Field(default=25, alias="WS_BATCH_WINDOW_MS")
+    ws_batch_max_messages: int = Field(default=64, alias="WS_BATCH_MAX_MESSAGES")
+    # Large binary frames are zstd-compressed once per broadcast, so
+    # per-connection permessage-deflate is off by default
+    ws_per_message_deflate: bool = Field(default=False, alias="WS_PER_MESSAGE_DEFLATE")
+
+    # Alert deduplication Bloom filter (process-local; startup fails unless WORKERS=1)
+    dedup_bloom_filter: bool = Field(default=False, alias="DEDUP_BLOOM_FILTER")
+    dedup_bloom_window_minutes: int = Field(default=60, alias="DEDUP_BLOOM_WINDOW_MINUTES")
+    dedup_bloom_capacity: int = Field(default=100_000, alias="DEDUP_BLOOM_CAPACITY")
 
     # SLA Configuration (minutes)
     sla_critical_first_response: int = Field(
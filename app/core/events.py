@@ -2,11 +2,22 @@
 
 import logging
 
+from app.config import settings
 from app.db.base import engine
+from app.db.redis import redis_pool
 
 logger = logging.getLogger(__name__)
 
 
+def check_dedup_bloom_filter() -> None:
+    """Refuse to start with the process-local dedup Bloom filter under several workers."""
+    if settings.dedup_bloom_filter and settings.workers > 1:
+        raise RuntimeError(
+            "DEDUP_BLOOM_FILTER requires WORKERS=1: each worker's filter only "
+            "sees the alerts that worker wrote"
+        )
+
+
 async def connect_to_db() -> None:
     """Initialize database connections on startup."""
     logger.info("Connecting to database...")
@@ -28,3 +39,15 @@ async def close_db_connection() -> None:
         logger.info("✅ Database connections closed")
     except Exception as e:
         logger.error(f"❌ Error closing database connections: {e}")
+
+
+async def close_redis_pool() -> None:
+    """Close pooled Redis connections on shutdown."""
+    if redis_pool is None:
+        return
+
+    try:
+        await redis_pool.disconnect()
+        logger.info("✅ Redis connections closed")
+    except Exception as e:
+        logger.error(f"❌ Error closing Redis connections: {e}")
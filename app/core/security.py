@@ -1,7 +1,7 @@
 """Security utilities for authentication and authorization."""
 
 from datetime import datetime, timedelta
-from typing import Optional
+from typing import Optional, Tuple
 
 from jose import JWTError, jwt
 from passlib.context import CryptContext
@@ -9,8 +9,16 @@ from pydantic import BaseModel
 
 from app.config import settings
 
-# Password hashing
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+# Password hashing: new hashes use Argon2id (argon2-cffi); bcrypt hashes from
+# before the switch still verify and are upgraded on the next login.
+pwd_context = CryptContext(
+    schemes=["argon2", "bcrypt"],
+    deprecated="auto",
+    argon2__type="ID",
+    argon2__time_cost=2,
+    argon2__memory_cost=65536,
+    argon2__parallelism=2,
+)
 
 
 class TokenData(BaseModel):
@@ -25,6 +33,24 @@ def verify_password(plain_password: str, hashed_password: str) -> bool:
     return pwd_context.verify(plain_password, hashed_password)
 
 
+def verify_and_update_password(
+    plain_password: str,
+    hashed_password: str
+) -> Tuple[bool, Optional[str]]:
+    """
+    Verify a password and rehash it if the stored hash is outdated.
+
+    Args:
+        plain_password: Password supplied by the user
+        hashed_password: Stored password hash
+
+    Returns:
+        Tuple of (verified, new_hash); new_hash is None unless the stored
+        hash uses a deprecated scheme or parameters
+    """
+    return pwd_context.verify_and_update(plain_password, hashed_password)
+
+
 def get_password_hash(password: str) -> str:
     """Hash a password."""
     return pwd_context.hash(password)
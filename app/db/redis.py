@@ -0,0 +1,40 @@
+"""Redis connection pool configuration."""
+
+from typing import Optional, Union
+
+from redis.asyncio import ConnectionPool, Redis
+from redis.asyncio.cluster import RedisCluster
+
+from app.config import settings
+
+# Shared connection pool for a standalone server; every Redis client in the
+# process draws from it. Cluster clients keep their own per-node pools.
+redis_pool: Optional[ConnectionPool] = (
+    None
+    if settings.redis_cluster
+    else ConnectionPool.from_url(
+        settings.redis_url,
+        password=settings.redis_password,
+        max_connections=settings.redis_max_connections,
+    )
+)
+
+
+def get_redis() -> Union[Redis, RedisCluster]:
+    """
+    Get a Redis client.
+
+    Standalone clients are cheap: connections are checked out of the shared
+    pool per command and returned afterwards. With REDIS_CLUSTER set this is
+    a RedisCluster instead, which routes each command (SPUBLISH and
+    SSUBSCRIBE included) to the shard owning its key or channel and follows
+    MOVED redirects; it owns its node connections until closed. Payloads are
+    returned as bytes.
+    """
+    if settings.redis_cluster:
+        return RedisCluster.from_url(
+            settings.redis_url,
+            password=settings.redis_password,
+            max_connections=settings.redis_max_connections,
+        )
+    return Redis(connection_pool=redis_pool)
@@ -4,10 +4,15 @@ from contextlib import asynccontextmanager
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, ORJSONResponse
 
 from app.config import settings
-from app.core.events import close_db_connection, connect_to_db
+from app.core.events import (
+    check_dedup_bloom_filter,
+    close_db_connection,
+    close_redis_pool,
+    connect_to_db,
+)
 from app.websocket.manager import manager
 
 
@@ -15,16 +20,18 @@ from app.websocket.manager import manager
 async def lifespan(app: FastAPI):
     """Application lifespan events."""
     # Startup
+    check_dedup_bloom_filter()
     await connect_to_db()
 
     # Set up Redis for WebSocket pub/sub if URL is configured
     if settings.redis_url:
-        await manager.setup_redis(settings.redis_url)
+        await manager.setup_redis()
 
     yield
 
     # Shutdown
     await manager.close_redis()
+    await close_redis_pool()
     await close_db_connection()
 
 
@@ -36,6 +43,7 @@ app = FastAPI(
     docs_url="/docs" if settings.debug else None,
     redoc_url="/redoc" if settings.debug else None,
     lifespan=lifespan,
+    default_response_class=ORJSONResponse,
 )
 
 # Configure CORS
@@ -117,4 +125,5 @@ if __name__ == "__main__":
         port=settings.port,
         reload=settings.debug,
         log_level=settings.log_level.lower(),
+        ws_per_message_deflate=settings.ws_per_message_deflate,
     )
@@ -4,7 +4,7 @@ from app.models.user import User
 from app.models.alert import Alert
 from app.models.incident import Incident, IncidentTimeline, AffectedAsset
 from app.models.observable import Observable
-from app.models.evidence import Evidence
+from app.models.evidence import Evidence, EvidenceCustodyEvent
 
 __all__ = [
     "User",
@@ -14,4 +14,5 @@ __all__ = [
     "AffectedAsset",
     "Observable",
     "Evidence",
+    "EvidenceCustodyEvent",
 ]
@@ -1,11 +1,14 @@
 """Alert model."""
 
-from datetime import datetime
+from typing import Optional
 
-from sqlalchemy import Column, DateTime, Integer, String, Text, Boolean, JSON
+from sqlalchemy import Column, DateTime, Integer, LargeBinary, String, Text, Boolean, JSON
 from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.orm import validates
+from sqlalchemy.sql import func
 
 from app.db.base import Base
+from app.models.enums import severity_enum
 
 
 class Alert(Base):
@@ -17,12 +20,7 @@ class Alert(Base):
     alert_id = Column(String(255), unique=True, nullable=False, index=True)
     title = Column(String(255), nullable=False)
     description = Column(Text)
-    severity = Column(
-        String(20),
-        nullable=False,
-        index=True,
-        comment="critical, high, medium, low, informational"
-    )
+    severity = Column(severity_enum, nullable=False, index=True)
     status = Column(
         String(30),
         nullable=False,
@@ -31,12 +29,21 @@ class Alert(Base):
         comment="new, acknowledged, investigating, resolved, false_positive, suppressed"
     )
     source = Column(String(100), comment="SIEM, EDR, Cloud, Manual")
+    category = Column(String(50))
     source_alert_id = Column(String(255))
     detection_rule_id = Column(String(100))
     detection_rule_name = Column(String(255))
+    dedup_hash = Column(
+        LargeBinary(16),
+        index=True,
+        comment="Deduplication fingerprint, maintained by the correlation service"
+    )
 
     # Alert data
     raw_event = Column(JSONB, comment="Original event data")
+    src_ip = Column(String(255), index=True, comment="Normalized from raw_event")
+    dst_ip = Column(String(255), index=True, comment="Normalized from raw_event")
+    hostname = Column(String(255), index=True, comment="Normalized from raw_event")
     observables = Column(JSONB, comment="IOCs and observables")
     affected_assets = Column(JSONB, comment="Affected hosts, users, etc.")
 
@@ -46,20 +53,40 @@ class Alert(Base):
 
     # Assignment and tracking
     assigned_to = Column(Integer)
-    acknowledged_at = Column(DateTime)
+    acknowledged_at = Column(DateTime(timezone=True))
     acknowledged_by = Column(Integer)
     escalated_to_incident_id = Column(Integer)
 
     # Timestamps
-    detected_at = Column(DateTime, nullable=False, default=datetime.utcnow)
-    created_at = Column(DateTime, default=datetime.utcnow, nullable=False, index=True)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
-    resolved_at = Column(DateTime)
+    detected_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+    created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False, index=True)
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
+    resolved_at = Column(DateTime(timezone=True))
 
     # Metadata
     tags = Column(JSONB)
     notes = Column(Text)
     false_positive_reason = Column(Text)
 
+    @validates("raw_event")
+    def _sync_event_keys(self, key, raw_event):
+        """Copy the correlation keys out of raw_event into indexed columns."""
+        event = raw_event if isinstance(raw_event, dict) else {}
+        self.src_ip = _first_present(event, ("source_ip",), ("src_ip",), ("source", "ip"))
+        self.dst_ip = _first_present(event, ("destination_ip",), ("dest_ip",), ("destination", "ip"))
+        self.hostname = _first_present(event, ("hostname",), ("host",), ("computer_name",))
+        return raw_event
+
     def __repr__(self):
         return f"<Alert(id={self.id}, severity='{self.severity}', status='{self.status}')>"
+
+
+def _first_present(event: dict, *paths) -> Optional[str]:
+    """First non-empty value among the given key paths, as a string."""
+    for path in paths:
+        value = event
+        for part in path:
+            value = value.get(part) if isinstance(value, dict) else None
+        if value:
+            return str(value)
+    return None
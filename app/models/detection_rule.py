@@ -1,10 +1,11 @@
 """
 Detection Rule Models - Custom detection rules and YARA/Sigma rules
 """
-from sqlalchemy import Column, Integer, String, Text, Boolean, DateTime, ForeignKey, JSON as JSONB
+from sqlalchemy import Column, Integer, String, Text, Boolean, DateTime, ForeignKey, Index, JSON as JSONB, text
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 from app.db.base import Base
+from app.models.enums import severity_enum
 
 
 class DetectionRule(Base):
@@ -12,6 +13,10 @@ class DetectionRule(Base):
     Custom detection rules for threat hunting and alerting.
     """
     __tablename__ = "detection_rules"
+    __table_args__ = (
+        # Partial index: listings almost always filter on enabled rules
+        Index("ix_detection_rules_enabled", "id", postgresql_where=text("is_enabled")),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     rule_id = Column(String(255), unique=True, nullable=False, index=True)  # rule-001, sigma-002
@@ -26,7 +31,7 @@ class DetectionRule(Base):
     rule_format = Column(String(20), nullable=False)  # yaml, text, json
 
     # Classification
-    severity = Column(String(20), nullable=False, index=True)  # critical, high, medium, low, info
+    severity = Column(severity_enum, nullable=False, index=True)
     category = Column(String(100), nullable=False, index=True)  # Malware, Phishing, etc.
     tags = Column(JSONB)  # Search tags
 
@@ -44,7 +49,7 @@ class DetectionRule(Base):
     references = Column(JSONB)  # URLs to threat reports, CVEs, etc.
 
     # Status and deployment
-    is_enabled = Column(Boolean, default=False, index=True)
+    is_enabled = Column(Boolean, default=False)
     is_validated = Column(Boolean, default=False)
     deployed_to = Column(JSONB)  # List of SIEM platforms where deployed
 
@@ -52,14 +57,14 @@ class DetectionRule(Base):
     alert_count_24h = Column(Integer, default=0)
     alert_count_7d = Column(Integer, default=0)
     true_positive_rate = Column(Integer)  # Percentage
-    last_triggered_at = Column(DateTime)
+    last_triggered_at = Column(DateTime(timezone=True))
 
     # Version control
     version = Column(String(20), nullable=False, default="1.0.0")
     changelog = Column(JSONB)  # Version history
 
-    created_at = Column(DateTime, server_default=func.now(), nullable=False)
-    updated_at = Column(DateTime, server_default=func.now(), onupdate=func.now(), nullable=False)
+    created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now(), nullable=False)
     created_by = Column(Integer, ForeignKey("users.id"))
 
     # Relationships
@@ -85,7 +90,7 @@ class RuleTuning(Base):
     false_positive_reduction = Column(Integer)  # Percentage
     alert_volume_change = Column(Integer)  # Percentage change
 
-    applied_at = Column(DateTime, server_default=func.now(), nullable=False)
+    applied_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
     applied_by = Column(Integer, ForeignKey("users.id"), nullable=False)
 
     # Relationships
@@ -0,0 +1,25 @@
+"""Shared PostgreSQL enum types for model columns."""
+
+from sqlalchemy import Enum
+
+SEVERITY_LEVELS = ("critical", "high", "medium", "low", "informational")
+INCIDENT_STATUSES = (
+    "new",
+    "assigned",
+    "investigating",
+    "contained",
+    "eradicated",
+    "recovered",
+    "closed",
+    "reopened",
+)
+EXECUTION_STATUSES = ("pending", "running", "paused", "completed", "failed", "cancelled")
+TLP_LEVELS = ("white", "green", "amber", "red")
+USER_ROLES = ("analyst", "senior_analyst", "manager", "admin")
+
+# Each type is created once and shared by every column that uses it
+severity_enum = Enum(*SEVERITY_LEVELS, name="severity_enum")
+incident_status_enum = Enum(*INCIDENT_STATUSES, name="incident_status_enum")
+execution_status_enum = Enum(*EXECUTION_STATUSES, name="execution_status_enum")
+tlp_enum = Enum(*TLP_LEVELS, name="tlp_enum")
+user_role_enum = Enum(*USER_ROLES, name="user_role_enum")
@@ -1,10 +1,9 @@
 """Evidence model."""
 
-from datetime import datetime
-
-from sqlalchemy import Column, DateTime, ForeignKey, Integer, String, Text, BigInteger
+from sqlalchemy import Column, DateTime, ForeignKey, Index, Identity, Integer, LargeBinary, String, Text, BigInteger
 from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import relationship
+from sqlalchemy.sql import func
 
 from app.db.base import Base
 
@@ -13,6 +12,15 @@ class Evidence(Base):
     """Evidence with chain of custody model."""
 
     __tablename__ = "evidence"
+    __table_args__ = (
+        # BRIN: rows are inserted in created_at order, so block ranges summarize it in a few KB
+        Index(
+            "ix_evidence_created_at_brin",
+            "created_at",
+            postgresql_using="brin",
+            postgresql_with={"pages_per_range": 32}
+        ),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     incident_id = Column(
@@ -23,16 +31,20 @@ class Evidence(Base):
     )
     filename = Column(String(255))
     file_path = Column(String(500))
-    file_hash_sha256 = Column(String(64), index=True)
-    file_hash_md5 = Column(String(32))
+    # Raw digest bytes (bytea), hex-encoded only for display
+    file_hash_sha256 = Column(LargeBinary(32), index=True)
+    file_hash_md5 = Column(LargeBinary(16))
     file_size = Column(BigInteger)
     mime_type = Column(String(100))
     description = Column(Text)
 
     # Chain of custody
     collected_by = Column(Integer, ForeignKey("users.id"))
-    collected_at = Column(DateTime, default=datetime.utcnow, nullable=False)
-    chain_of_custody = Column(JSONB, comment="Array of custody transfer records")
+    collected_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+    chain_of_custody = Column(
+        JSONB,
+        comment="Legacy custody transfer records (read-only, superseded by evidence_custody_events)"
+    )
 
     # Storage
     storage_location = Column(String(255))
@@ -40,10 +52,46 @@ class Evidence(Base):
 
     # Metadata
     tags = Column(JSONB)
-    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+    created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
 
     # Relationships
     incident = relationship("Incident", back_populates="evidence")
+    custody_events = relationship(
+        "EvidenceCustodyEvent",
+        back_populates="evidence",
+        cascade="all, delete-orphan",
+        order_by="EvidenceCustodyEvent.occurred_at"
+    )
+
+    def __repr__(self):
+        sha256 = self.file_hash_sha256.hex() if self.file_hash_sha256 else ""
+        return f"<Evidence(id={self.id}, filename='{self.filename}', hash='{sha256[:16]}...')>"
+
+
+class EvidenceCustodyEvent(Base):
+    """Chain of custody record for a piece of evidence (append-only)."""
+
+    __tablename__ = "evidence_custody_events"
+    __table_args__ = (
+        Index("ix_evidence_custody_events_evidence_occurred", "evidence_id", "occurred_at"),
+    )
+
+    id = Column(BigInteger, Identity(always=False), primary_key=True)
+    evidence_id = Column(
+        Integer,
+        ForeignKey("evidence.id", ondelete="CASCADE"),
+        nullable=False
+    )
+    actor_id = Column(Integer, ForeignKey("users.id"))
+    action = Column(
+        String(50),
+        nullable=False,
+        comment="collected, transferred, analyzed, stored, released"
+    )
+    occurred_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+
+    # Relationships
+    evidence = relationship("Evidence", back_populates="custody_events")
 
     def __repr__(self):
-        return f"<Evidence(id={self.id}, filename='{self.filename}', hash='{self.file_hash_sha256[:16]}...')>"
+        return f"<EvidenceCustodyEvent(id={self.id}, evidence_id={self.evidence_id}, action='{self.action}')>"
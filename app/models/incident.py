@@ -1,12 +1,12 @@
 """Incident models."""
 
-from datetime import datetime
-
-from sqlalchemy import Column, DateTime, ForeignKey, Integer, String, Text, Boolean
+from sqlalchemy import Column, DateTime, ForeignKey, Index, BigInteger, Identity, Integer, String, Text, Boolean
 from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import relationship
+from sqlalchemy.sql import func
 
 from app.db.base import Base
+from app.models.enums import incident_status_enum, severity_enum
 
 
 class Incident(Base):
@@ -18,19 +18,8 @@ class Incident(Base):
     ticket_number = Column(String(20), unique=True, nullable=False, index=True)
     title = Column(String(255), nullable=False)
     description = Column(Text)
-    severity = Column(
-        String(20),
-        nullable=False,
-        index=True,
-        comment="critical, high, medium, low, informational"
-    )
-    status = Column(
-        String(30),
-        nullable=False,
-        default="new",
-        index=True,
-        comment="new, assigned, investigating, contained, eradicated, recovered, closed, reopened"
-    )
+    severity = Column(severity_enum, nullable=False, index=True)
+    status = Column(incident_status_enum, nullable=False, default="new", index=True)
     category = Column(String(50))
     detection_source = Column(String(100))
     source_alert_id = Column(String(255))
@@ -44,17 +33,17 @@ class Incident(Base):
     business_impact = Column(String(20), comment="critical, high, medium, low, none")
 
     # Timestamps
-    created_at = Column(DateTime, default=datetime.utcnow, nullable=False, index=True)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
-    first_response_at = Column(DateTime)
-    containment_at = Column(DateTime)
-    resolution_at = Column(DateTime)
-    closed_at = Column(DateTime)
+    created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False, index=True)
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
+    first_response_at = Column(DateTime(timezone=True))
+    containment_at = Column(DateTime(timezone=True))
+    resolution_at = Column(DateTime(timezone=True))
+    closed_at = Column(DateTime(timezone=True))
 
     # SLA tracking
     sla_breach = Column(Boolean, default=False)
-    sla_first_response_due = Column(DateTime)
-    sla_resolution_due = Column(DateTime)
+    sla_first_response_due = Column(DateTime(timezone=True))
+    sla_resolution_due = Column(DateTime(timezone=True))
 
     # Playbook
     playbook_id = Column(Integer)
@@ -110,13 +99,21 @@ class IncidentTimeline(Base):
     """Incident timeline/audit log model."""
 
     __tablename__ = "incident_timeline"
+    __table_args__ = (
+        # BRIN: rows are inserted in created_at order, so block ranges summarize it in a few KB
+        Index(
+            "ix_incident_timeline_created_at_brin",
+            "created_at",
+            postgresql_using="brin",
+            postgresql_with={"pages_per_range": 32}
+        ),
+    )
 
-    id = Column(Integer, primary_key=True, index=True)
+    id = Column(BigInteger, Identity(always=False), primary_key=True)
     incident_id = Column(
         Integer,
         ForeignKey("incidents.id", ondelete="CASCADE"),
-        nullable=False,
-        index=True
+        nullable=False
     )
     action_type = Column(String(50), nullable=False)
     actor_id = Column(Integer, ForeignKey("users.id"))
@@ -124,7 +121,8 @@ class IncidentTimeline(Base):
     old_value = Column(JSONB)
     new_value = Column(JSONB)
     description = Column(Text)
-    created_at = Column(DateTime, default=datetime.utcnow, nullable=False, index=True)
+    # clock_timestamp(), not now(): entries written in one transaction keep their order
+    created_at = Column(DateTime(timezone=True), server_default=func.clock_timestamp(), nullable=False)
 
     # Relationships
     incident = relationship("Incident", back_populates="timeline")
@@ -133,6 +131,18 @@ class IncidentTimeline(Base):
         return f"<IncidentTimeline(id={self.id}, incident_id={self.incident_id}, action='{self.action_type}')>"
 
 
+# Timeline reads are "entries for one incident by time"; the INCLUDE columns
+# let listings that only need the summary fields skip the heap. description
+# is unbounded text and stays out, since a long one would exceed the btree
+# row size limit.
+Index(
+    "ix_incident_timeline_incident_created",
+    IncidentTimeline.incident_id,
+    IncidentTimeline.created_at.desc(),
+    postgresql_include=["action_type", "actor_id"]
+)
+
+
 class AffectedAsset(Base):
     """Affected assets in an incident."""
 
@@ -1,20 +1,35 @@
 """Observable/IOC model."""
 
-from datetime import datetime
-
-from sqlalchemy import Column, DateTime, ForeignKey, Integer, String, Text, Boolean
+from sqlalchemy import Column, DateTime, ForeignKey, Index, BigInteger, Identity, Integer, LargeBinary, String, Text, Boolean, text
 from sqlalchemy.dialects.postgresql import JSONB
-from sqlalchemy.orm import relationship
+from sqlalchemy.orm import relationship, validates
+from sqlalchemy.sql import func
 
 from app.db.base import Base
+from app.models.enums import tlp_enum
 
 
 class Observable(Base):
     """Observable/Indicator of Compromise (IOC) model."""
 
     __tablename__ = "observables"
+    # Hash IOC lookups compare raw digest bytes instead of hex text
+    __table_args__ = (
+        Index(
+            "ix_observables_hash_value",
+            "hash_value",
+            postgresql_where=text("type LIKE 'hash_%'")
+        ),
+        # BRIN: rows are inserted in created_at order, so block ranges summarize it in a few KB
+        Index(
+            "ix_observables_created_at_brin",
+            "created_at",
+            postgresql_using="brin",
+            postgresql_with={"pages_per_range": 32}
+        ),
+    )
 
-    id = Column(Integer, primary_key=True, index=True)
+    id = Column(BigInteger, Identity(always=False), primary_key=True)
     incident_id = Column(
         Integer,
         ForeignKey("incidents.id", ondelete="CASCADE"),
@@ -27,19 +42,16 @@ class Observable(Base):
         comment="ip, domain, url, hash_md5, hash_sha1, hash_sha256, email, filename, registry_key, user_account, process"
     )
     value = Column(Text, nullable=False, index=True)
-    tlp = Column(
-        String(10),
-        default="amber",
-        comment="TLP: white, green, amber, red"
-    )
+    hash_value = Column(LargeBinary(32), comment="Raw digest bytes for hash_* observables")
+    tlp = Column(tlp_enum, default="amber", comment="Traffic Light Protocol")
     is_malicious = Column(Boolean)
     confidence = Column(String(20), comment="high, medium, low")
     source = Column(String(100), comment="Where the IOC was identified")
 
     # Timestamps
-    first_seen = Column(DateTime)
-    last_seen = Column(DateTime)
-    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+    first_seen = Column(DateTime(timezone=True))
+    last_seen = Column(DateTime(timezone=True))
+    created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
 
     # Additional context
     context = Column(JSONB, comment="Additional metadata")
@@ -48,5 +60,20 @@ class Observable(Base):
     # Relationships
     incident = relationship("Incident", back_populates="observables")
 
+    @validates("type", "value")
+    def _sync_hash_value(self, key, field_value):
+        """Keep hash_value in step with the hex digest held in value."""
+        obs_type = field_value if key == "type" else self.type
+        hex_value = field_value if key == "value" else self.value
+
+        self.hash_value = None
+        if obs_type and obs_type.startswith("hash_") and hex_value:
+            try:
+                self.hash_value = bytes.fromhex(hex_value.strip())
+            except ValueError:
+                pass
+
+        return field_value
+
     def __repr__(self):
         return f"<Observable(id={self.id}, type='{self.type}', value='{self.value[:50]}')>"
@@ -1,10 +1,11 @@
 """
 Playbook Models - SOC automation playbooks and execution tracking
 """
-from sqlalchemy import Column, Integer, String, Text, Boolean, DateTime, ForeignKey, JSON as JSONB
+from sqlalchemy import Column, BigInteger, Identity, Integer, String, Text, Boolean, DateTime, ForeignKey, Index, JSON as JSONB, text
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 from app.db.base import Base
+from app.models.enums import execution_status_enum, severity_enum
 
 
 class Playbook(Base):
@@ -12,12 +13,16 @@ class Playbook(Base):
     Playbook template for automated response actions.
     """
     __tablename__ = "playbooks"
+    __table_args__ = (
+        # Partial index: execution and listings only look up active playbooks
+        Index("ix_playbooks_active", "id", postgresql_where=text("is_active")),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     name = Column(String(255), nullable=False, index=True)
     description = Column(Text)
     category = Column(String(100), nullable=False, index=True)  # Malware, Phishing, DDoS, etc.
-    severity = Column(String(20), index=True)  # critical, high, medium, low
+    severity = Column(severity_enum, index=True)
 
     # Playbook definition
     steps = Column(JSONB, nullable=False)  # Array of step definitions
@@ -31,15 +36,20 @@ class Playbook(Base):
 
     # Metadata
     version = Column(String(20), nullable=False, default="1.0.0")
-    is_active = Column(Boolean, default=True, index=True)
+    is_active = Column(Boolean, default=True)
     tags = Column(JSONB)  # Search tags
 
-    created_at = Column(DateTime, server_default=func.now(), nullable=False)
-    updated_at = Column(DateTime, server_default=func.now(), onupdate=func.now(), nullable=False)
+    created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now(), nullable=False)
     created_by = Column(Integer, ForeignKey("users.id"))
 
     # Relationships
-    executions = relationship("PlaybookExecution", back_populates="playbook", cascade="all, delete-orphan")
+    executions = relationship(
+        "PlaybookExecution",
+        back_populates="playbook",
+        cascade="all, delete-orphan",
+        passive_deletes=True  # rows are removed by ON DELETE CASCADE
+    )
     creator = relationship("User", foreign_keys=[created_by])
 
 
@@ -48,14 +58,22 @@ class PlaybookExecution(Base):
     Track playbook execution instances.
     """
     __tablename__ = "playbook_executions"
-
-    id = Column(Integer, primary_key=True, index=True)
-    playbook_id = Column(Integer, ForeignKey("playbooks.id"), nullable=False, index=True)
+    __table_args__ = (
+        # BRIN: rows are inserted in created_at order, so block ranges summarize it in a few KB
+        Index(
+            "ix_playbook_executions_created_at_brin",
+            "created_at",
+            postgresql_using="brin",
+            postgresql_with={"pages_per_range": 32}
+        ),
+    )
+
+    id = Column(BigInteger, Identity(always=False), primary_key=True)
+    playbook_id = Column(Integer, ForeignKey("playbooks.id", ondelete="CASCADE"), nullable=False, index=True)
     incident_id = Column(Integer, ForeignKey("incidents.id"), nullable=True, index=True)
 
     # Execution metadata
-    status = Column(String(30), nullable=False, default="pending", index=True)
-    # Statuses: pending, running, paused, completed, failed, cancelled
+    status = Column(execution_status_enum, nullable=False, default="pending", index=True)
 
     # Execution data
     current_step = Column(Integer, default=0)  # Current step index
@@ -63,21 +81,21 @@ class PlaybookExecution(Base):
     variables = Column(JSONB)  # Runtime variables
 
     # Timing
-    started_at = Column(DateTime)
-    completed_at = Column(DateTime)
+    started_at = Column(DateTime(timezone=True))
+    completed_at = Column(DateTime(timezone=True))
     duration_seconds = Column(Integer)
 
     # Human interaction
     triggered_by = Column(Integer, ForeignKey("users.id"), nullable=False)
     approved_by = Column(Integer, ForeignKey("users.id"))
-    approved_at = Column(DateTime)
+    approved_at = Column(DateTime(timezone=True))
 
     # Error handling
     error_message = Column(Text)
     retry_count = Column(Integer, default=0)
 
-    created_at = Column(DateTime, server_default=func.now(), nullable=False)
-    updated_at = Column(DateTime, server_default=func.now(), onupdate=func.now(), nullable=False)
+    created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now(), nullable=False)
 
     # Relationships
     playbook = relationship("Playbook", back_populates="executions")
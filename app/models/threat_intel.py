@@ -1,10 +1,11 @@
 """
 Threat Intelligence Models - External threat feeds and indicators
 """
-from sqlalchemy import Column, Integer, String, Text, Boolean, DateTime, ForeignKey, JSON as JSONB, Float
+from sqlalchemy import Column, BigInteger, Identity, Integer, String, Text, Boolean, DateTime, ForeignKey, Index, JSON as JSONB, Float, text
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 from app.db.base import Base
+from app.models.enums import severity_enum, tlp_enum
 
 
 class ThreatFeed(Base):
@@ -12,6 +13,10 @@ class ThreatFeed(Base):
     External threat intelligence feed configuration.
     """
     __tablename__ = "threat_feeds"
+    __table_args__ = (
+        # Partial index: the poller only looks at enabled feeds
+        Index("ix_threat_feeds_enabled", "id", postgresql_where=text("is_enabled")),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     name = Column(String(255), nullable=False, unique=True, index=True)
@@ -24,10 +29,10 @@ class ThreatFeed(Base):
     auth_method = Column(String(50))  # api_key, oauth, basic, none
 
     # Feed settings
-    is_enabled = Column(Boolean, default=True, index=True)
+    is_enabled = Column(Boolean, default=True)
     poll_interval_minutes = Column(Integer, default=60)  # How often to fetch
-    last_poll_at = Column(DateTime)
-    next_poll_at = Column(DateTime)
+    last_poll_at = Column(DateTime(timezone=True))
+    next_poll_at = Column(DateTime(timezone=True))
 
     # Quality metrics
     reliability_score = Column(Float)  # 0.0 to 1.0
@@ -38,12 +43,17 @@ class ThreatFeed(Base):
     filter_config = Column(JSONB)  # Filters for what to import
     tags = Column(JSONB)  # Classification tags
 
-    created_at = Column(DateTime, server_default=func.now(), nullable=False)
-    updated_at = Column(DateTime, server_default=func.now(), onupdate=func.now(), nullable=False)
+    created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now(), nullable=False)
     created_by = Column(Integer, ForeignKey("users.id"))
 
     # Relationships
-    indicators = relationship("ThreatIndicator", back_populates="feed", cascade="all, delete-orphan")
+    indicators = relationship(
+        "ThreatIndicator",
+        back_populates="feed",
+        cascade="all, delete-orphan",
+        passive_deletes=True  # rows are removed by ON DELETE CASCADE
+    )
     creator = relationship("User", foreign_keys=[created_by])
 
 
@@ -52,9 +62,32 @@ class ThreatIndicator(Base):
     Threat intelligence indicator (IOC) from external feeds.
     """
     __tablename__ = "threat_indicators"
-
-    id = Column(Integer, primary_key=True, index=True)
-    feed_id = Column(Integer, ForeignKey("threat_feeds.id"), nullable=False, index=True)
+    __table_args__ = (
+        # Partial index: matching only considers live, non-false-positive indicators.
+        # Expiry is checked at query time since now() is not allowed in an index predicate.
+        Index(
+            "ix_threat_indicators_active",
+            "id",
+            postgresql_where=text("is_active AND NOT false_positive")
+        ),
+        # BRIN: rows are inserted in created_at order, so block ranges summarize it in a few KB
+        Index(
+            "ix_threat_indicators_created_at_brin",
+            "created_at",
+            postgresql_using="brin",
+            postgresql_with={"pages_per_range": 32}
+        ),
+        # last_seen mostly advances with ingestion, so it correlates well enough for BRIN too
+        Index(
+            "ix_threat_indicators_last_seen_brin",
+            "last_seen",
+            postgresql_using="brin",
+            postgresql_with={"pages_per_range": 32}
+        ),
+    )
+
+    id = Column(BigInteger, Identity(always=False), primary_key=True)
+    feed_id = Column(Integer, ForeignKey("threat_feeds.id", ondelete="CASCADE"), nullable=False, index=True)
 
     # Indicator details
     indicator_type = Column(String(50), nullable=False, index=True)
@@ -74,26 +107,26 @@ class ThreatIndicator(Base):
 
     # Confidence and severity
     confidence_score = Column(Float)  # 0.0 to 1.0
-    severity = Column(String(20), index=True)  # critical, high, medium, low
-    tlp = Column(String(20), default="amber")  # TLP classification
+    severity = Column(severity_enum, index=True)
+    tlp = Column(tlp_enum, default="amber")  # TLP classification
 
     # Context
-    first_seen = Column(DateTime)
-    last_seen = Column(DateTime)
+    first_seen = Column(DateTime(timezone=True))
+    last_seen = Column(DateTime(timezone=True))
     source_references = Column(JSONB)  # URLs to original reports
     related_campaigns = Column(JSONB)  # APT groups, campaigns
 
     # Status
-    is_active = Column(Boolean, default=True, index=True)
-    expiration_date = Column(DateTime)
+    is_active = Column(Boolean, default=True)
+    expiration_date = Column(DateTime(timezone=True))
     false_positive = Column(Boolean, default=False)
 
     # Matching statistics
     match_count = Column(Integer, default=0)  # How many times matched in alerts
-    last_matched_at = Column(DateTime)
+    last_matched_at = Column(DateTime(timezone=True))
 
-    created_at = Column(DateTime, server_default=func.now(), nullable=False)
-    updated_at = Column(DateTime, server_default=func.now(), onupdate=func.now(), nullable=False)
+    created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now(), nullable=False)
 
     # Relationships
     feed = relationship("ThreatFeed", back_populates="indicators")
@@ -123,12 +156,12 @@ class ThreatActor(Base):
     tools_used = Column(JSONB)  # Malware, exploits used
 
     # Activity
-    first_observed = Column(DateTime)
-    last_observed = Column(DateTime)
+    first_observed = Column(DateTime(timezone=True))
+    last_observed = Column(DateTime(timezone=True))
     is_active = Column(Boolean, default=True)
 
     # References
     references = Column(JSONB)  # Threat reports, URLs
 
-    created_at = Column(DateTime, server_default=func.now(), nullable=False)
-    updated_at = Column(DateTime, server_default=func.now(), onupdate=func.now(), nullable=False)
+    created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now(), nullable=False)
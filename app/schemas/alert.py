@@ -12,6 +12,7 @@ class AlertBase(BaseModel):
     description: Optional[str] = None
     severity: str = Field(..., pattern="^(critical|high|medium|low|informational)$")
     source: Optional[str] = Field(None, max_length=100)
+    category: Optional[str] = Field(None, max_length=50)
     detection_rule_id: Optional[str] = None
     detection_rule_name: Optional[str] = None
 
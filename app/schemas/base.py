@@ -0,0 +1,31 @@
+"""Shared Pydantic base schemas."""
+
+from typing import Any, Literal
+
+from pydantic import BaseModel, ConfigDict
+
+from app.models.enums import EXECUTION_STATUSES, INCIDENT_STATUSES, SEVERITY_LEVELS
+
+# Values accepted by the native PostgreSQL enum columns, so bad input is a 422
+# rather than a DataError from the database
+Severity = Literal[SEVERITY_LEVELS]
+IncidentStatus = Literal[INCIDENT_STATUSES]
+ExecutionStatus = Literal[EXECUTION_STATUSES]
+
+
+class ResponseModel(BaseModel):
+    """Base schema for responses built from ORM objects."""
+    model_config = ConfigDict(from_attributes=True)
+
+    @classmethod
+    def from_orm_trusted(cls, obj: Any):
+        """
+        Build the schema from an ORM object without running validation.
+
+        Only for rows loaded straight from the database, whose column types
+        already match the schema; nested models are not converted. Untrusted
+        input must still go through model_validate.
+        """
+        return cls.model_construct(
+            **{name: getattr(obj, name) for name in cls.model_fields}
+        )
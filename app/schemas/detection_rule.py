@@ -2,8 +2,10 @@
 Detection Rule Schemas
 """
 from datetime import datetime
-from typing import Optional, List
-from pydantic import BaseModel, Field
+from typing import Optional
+from pydantic import BaseModel, ConfigDict, Field
+
+from app.schemas.base import Severity
 
 
 class DetectionRuleCreate(BaseModel):
@@ -14,16 +16,16 @@ class DetectionRuleCreate(BaseModel):
     rule_type: str
     rule_content: str
     rule_format: str  # yaml, text, json
-    severity: str
+    severity: Severity
     category: str
-    tags: Optional[List[str]] = None
-    mitre_tactics: Optional[List[str]] = None
-    mitre_techniques: Optional[List[str]] = None
-    platforms: Optional[List[str]] = None
-    data_sources: Optional[List[str]] = None
+    tags: Optional[list[str]] = None
+    mitre_tactics: Optional[list[str]] = None
+    mitre_techniques: Optional[list[str]] = None
+    platforms: Optional[list[str]] = None
+    data_sources: Optional[list[str]] = None
     false_positive_rate: Optional[str] = None
     detection_methodology: Optional[str] = None
-    references: Optional[List[str]] = None
+    references: Optional[list[str]] = None
     is_enabled: bool = False
 
 
@@ -32,22 +34,24 @@ class DetectionRuleUpdate(BaseModel):
     name: Optional[str] = Field(None, min_length=1, max_length=255)
     description: Optional[str] = None
     rule_content: Optional[str] = None
-    severity: Optional[str] = None
+    severity: Optional[Severity] = None
     category: Optional[str] = None
-    tags: Optional[List[str]] = None
-    mitre_tactics: Optional[List[str]] = None
-    mitre_techniques: Optional[List[str]] = None
-    platforms: Optional[List[str]] = None
-    data_sources: Optional[List[str]] = None
+    tags: Optional[list[str]] = None
+    mitre_tactics: Optional[list[str]] = None
+    mitre_techniques: Optional[list[str]] = None
+    platforms: Optional[list[str]] = None
+    data_sources: Optional[list[str]] = None
     false_positive_rate: Optional[str] = None
     detection_methodology: Optional[str] = None
-    references: Optional[List[str]] = None
+    references: Optional[list[str]] = None
     is_enabled: Optional[bool] = None
     is_validated: Optional[bool] = None
 
 
 class DetectionRuleResponse(BaseModel):
     """Detection rule response model."""
+    model_config = ConfigDict(from_attributes=True)
+
     id: int
     rule_id: str
     name: str
@@ -55,19 +59,19 @@ class DetectionRuleResponse(BaseModel):
     rule_type: str
     rule_content: str
     rule_format: str
-    severity: str
+    severity: Severity
     category: str
-    tags: Optional[List[str]]
-    mitre_tactics: Optional[List[str]]
-    mitre_techniques: Optional[List[str]]
-    platforms: Optional[List[str]]
-    data_sources: Optional[List[str]]
+    tags: Optional[list[str]]
+    mitre_tactics: Optional[list[str]]
+    mitre_techniques: Optional[list[str]]
+    platforms: Optional[list[str]]
+    data_sources: Optional[list[str]]
     false_positive_rate: Optional[str]
     detection_methodology: Optional[str]
-    references: Optional[List[str]]
+    references: Optional[list[str]]
     is_enabled: bool
     is_validated: bool
-    deployed_to: Optional[List[str]]
+    deployed_to: Optional[list[str]]
     alert_count_24h: int
     alert_count_7d: int
     true_positive_rate: Optional[int]
@@ -77,16 +81,13 @@ class DetectionRuleResponse(BaseModel):
     updated_at: datetime
     created_by: Optional[int]
 
-    class Config:
-        from_attributes = True
-
 
 class DetectionRuleListResponse(BaseModel):
     """List of detection rules."""
     total: int
     page: int
     page_size: int
-    rules: List[DetectionRuleResponse]
+    rules: list[DetectionRuleResponse]
 
 
 class RuleTuningCreate(BaseModel):
@@ -1,19 +1,23 @@
 """Incident Pydantic schemas."""
 
 from datetime import datetime
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Literal
 
-from pydantic import BaseModel, Field, ConfigDict
+from pydantic import BaseModel, Field
+
+from app.schemas.base import IncidentStatus, ResponseModel, Severity
+
+BusinessImpact = Literal["critical", "high", "medium", "low", "none"]
 
 
 class IncidentBase(BaseModel):
     """Base incident schema."""
     title: str = Field(..., max_length=255)
     description: Optional[str] = None
-    severity: str = Field(..., pattern="^(critical|high|medium|low|informational)$")
+    severity: Severity
     category: Optional[str] = Field(None, max_length=50)
     detection_source: Optional[str] = Field(None, max_length=100)
-    business_impact: Optional[str] = Field(None, pattern="^(critical|high|medium|low|none)$")
+    business_impact: Optional[BusinessImpact] = None
 
 
 class IncidentCreate(IncidentBase):
@@ -30,26 +34,22 @@ class IncidentUpdate(BaseModel):
     """Schema for updating incidents."""
     title: Optional[str] = Field(None, max_length=255)
     description: Optional[str] = None
-    severity: Optional[str] = Field(None, pattern="^(critical|high|medium|low|informational)$")
-    status: Optional[str] = Field(
-        None,
-        pattern="^(new|assigned|investigating|contained|eradicated|recovered|closed|reopened)$"
-    )
+    severity: Optional[Severity] = None
+    status: Optional[IncidentStatus] = None
     assigned_analyst_id: Optional[int] = None
     assigned_team_id: Optional[int] = None
-    business_impact: Optional[str] = None
+    business_impact: Optional[BusinessImpact] = None
     playbook_id: Optional[int] = None
     playbook_status: Optional[str] = None
     tags: Optional[Dict[str, Any]] = None
 
 
-class IncidentResponse(IncidentBase):
+class IncidentResponse(IncidentBase, ResponseModel):
     """Schema for incident responses."""
-    model_config = ConfigDict(from_attributes=True)
 
     id: int
     ticket_number: str
-    status: str
+    status: IncidentStatus
     source_alert_id: Optional[str] = None
     source_system: Optional[str] = None
     assigned_analyst_id: Optional[int] = None
@@ -5,6 +5,8 @@ from datetime import datetime
 from typing import Optional, List, Dict, Any
 from pydantic import BaseModel, Field
 
+from app.schemas.base import ExecutionStatus, ResponseModel, Severity
+
 
 # Playbook Schemas
 class PlaybookStepSchema(BaseModel):
@@ -23,7 +25,7 @@ class PlaybookCreate(BaseModel):
     name: str = Field(..., min_length=1, max_length=255)
     description: Optional[str] = None
     category: str
-    severity: Optional[str] = None
+    severity: Optional[Severity] = None
     steps: List[PlaybookStepSchema]
     mitre_tactics: Optional[List[str]] = None
     mitre_techniques: Optional[List[str]] = None
@@ -38,7 +40,7 @@ class PlaybookUpdate(BaseModel):
     name: Optional[str] = Field(None, min_length=1, max_length=255)
     description: Optional[str] = None
     category: Optional[str] = None
-    severity: Optional[str] = None
+    severity: Optional[Severity] = None
     steps: Optional[List[PlaybookStepSchema]] = None
     mitre_tactics: Optional[List[str]] = None
     mitre_techniques: Optional[List[str]] = None
@@ -49,13 +51,13 @@ class PlaybookUpdate(BaseModel):
     tags: Optional[List[str]] = None
 
 
-class PlaybookResponse(BaseModel):
+class PlaybookResponse(ResponseModel):
     """Playbook response model."""
     id: int
     name: str
     description: Optional[str]
     category: str
-    severity: Optional[str]
+    severity: Optional[Severity]
     steps: List[Dict[str, Any]]
     mitre_tactics: Optional[List[str]]
     mitre_techniques: Optional[List[str]]
@@ -69,9 +71,6 @@ class PlaybookResponse(BaseModel):
     updated_at: datetime
     created_by: Optional[int]
 
-    class Config:
-        from_attributes = True
-
 
 # Playbook Execution Schemas
 class PlaybookExecutionCreate(BaseModel):
@@ -83,7 +82,7 @@ class PlaybookExecutionCreate(BaseModel):
 
 class PlaybookExecutionUpdate(BaseModel):
     """Update execution status."""
-    status: Optional[str] = None
+    status: Optional[ExecutionStatus] = None
     current_step: Optional[int] = None
     step_results: Optional[Dict[str, Any]] = None
     variables: Optional[Dict[str, Any]] = None
@@ -95,12 +94,12 @@ class PlaybookExecutionApprove(BaseModel):
     comment: Optional[str] = None
 
 
-class PlaybookExecutionResponse(BaseModel):
+class PlaybookExecutionResponse(ResponseModel):
     """Playbook execution response."""
     id: int
     playbook_id: int
     incident_id: Optional[int]
-    status: str
+    status: ExecutionStatus
     current_step: int
     step_results: Optional[Dict[str, Any]]
     variables: Optional[Dict[str, Any]]
@@ -115,9 +114,6 @@ class PlaybookExecutionResponse(BaseModel):
     created_at: datetime
     updated_at: datetime
 
-    class Config:
-        from_attributes = True
-
 
 class PlaybookListResponse(BaseModel):
     """List of playbooks."""
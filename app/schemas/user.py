@@ -1,9 +1,13 @@
 """User Pydantic schemas."""
 
 from datetime import datetime
-from typing import Optional
+from typing import Optional, Literal
 
-from pydantic import BaseModel, EmailStr, Field, ConfigDict
+from pydantic import BaseModel, EmailStr, Field
+
+from app.schemas.base import ResponseModel
+
+UserRole = Literal["analyst", "senior_analyst", "manager", "admin"]
 
 
 class UserBase(BaseModel):
@@ -11,7 +15,7 @@ class UserBase(BaseModel):
     username: str = Field(..., min_length=3, max_length=50)
     email: EmailStr
     full_name: Optional[str] = Field(None, max_length=255)
-    role: str = Field(default="analyst", pattern="^(analyst|senior_analyst|manager|admin)$")
+    role: UserRole = "analyst"
 
 
 class UserCreate(UserBase):
@@ -23,13 +27,12 @@ class UserUpdate(BaseModel):
     """Schema for updating users."""
     email: Optional[EmailStr] = None
     full_name: Optional[str] = None
-    role: Optional[str] = None
+    role: Optional[UserRole] = None
     is_active: Optional[bool] = None
 
 
-class UserResponse(UserBase):
+class UserResponse(UserBase, ResponseModel):
     """Schema for user responses."""
-    model_config = ConfigDict(from_attributes=True)
 
     id: int
     is_active: bool
@@ -1,14 +1,26 @@
 """WebSocket endpoint handlers."""
 
 import logging
+from functools import lru_cache
+
 from fastapi import APIRouter, WebSocket, WebSocketDisconnect
 
-from app.websocket.manager import manager
+from app.websocket.manager import ALERTS, DASHBOARD, manager
 
 logger = logging.getLogger(__name__)
 
 router = APIRouter()
 
+# Welcome messages are fixed per stream, so build them once
+CONNECTED_ALERTS = '{"type":"connected","message":"Connected to alert stream"}'
+CONNECTED_DASHBOARD = '{"type":"connected","message":"Connected to dashboard stream"}'
+
+
+@lru_cache(maxsize=1024)
+def _incident_connected_message(incident_id: int) -> str:
+    """Welcome message for an incident stream, cached per incident."""
+    return f'{{"type":"connected","message":"Connected to incident {incident_id} stream"}}'
+
 
 @router.websocket("/ws/alerts")
 async def websocket_alerts(websocket: WebSocket):
@@ -24,33 +36,30 @@ async def websocket_alerts(websocket: WebSocket):
             "timestamp": "2026-01-15T10:30:00Z"
         }
 
+        Events arriving in a burst are delivered together as
+        {"type": "batch", "items": [ ... messages as above ... ]}.
+
     Args:
         websocket: WebSocket connection
     """
-    await manager.connect(websocket, channel="alerts")
+    await manager.connect(websocket, channel=ALERTS)
 
     try:
         # Send welcome message
-        await manager.send_personal_message(
-            '{"type":"connected","message":"Connected to alert stream"}',
-            websocket
-        )
+        await manager.send_personal_message(CONNECTED_ALERTS, websocket)
 
         # Keep connection alive and handle incoming messages
         while True:
             data = await websocket.receive_text()
             # Echo back for heartbeat
-            await manager.send_personal_message(
-                '{"type":"pong"}',
-                websocket
-            )
+            manager.send_pong(websocket)
 
     except WebSocketDisconnect:
-        manager.disconnect(websocket, channel="alerts")
+        manager.disconnect(websocket, channel=ALERTS)
         logger.info("Client disconnected from alerts stream")
     except Exception as e:
-        logger.error(f"WebSocket error in alerts stream: {e}")
-        manager.disconnect(websocket, channel="alerts")
+        logger.error("WebSocket error in alerts stream: %s", e)
+        manager.disconnect(websocket, channel=ALERTS)
 
 
 @router.websocket("/ws/incidents/{incident_id}")
@@ -66,30 +75,23 @@ async def websocket_incident(websocket: WebSocket, incident_id: int):
     """
     channel = f"incident_{incident_id}"
 
-    # Create channel if it doesn't exist
-    if channel not in manager.active_connections:
-        manager.active_connections[channel] = set()
-
     await manager.connect(websocket, channel=channel)
 
     try:
         await manager.send_personal_message(
-            f'{{"type":"connected","message":"Connected to incident {incident_id} stream"}}',
+            _incident_connected_message(incident_id),
             websocket
         )
 
         while True:
             data = await websocket.receive_text()
-            await manager.send_personal_message(
-                '{"type":"pong"}',
-                websocket
-            )
+            manager.send_pong(websocket)
 
     except WebSocketDisconnect:
         manager.disconnect(websocket, channel=channel)
-        logger.info(f"Client disconnected from incident {incident_id} stream")
+        logger.info("Client disconnected from incident %s stream", incident_id)
     except Exception as e:
-        logger.error(f"WebSocket error in incident {incident_id} stream: {e}")
+        logger.error("WebSocket error in incident %s stream: %s", incident_id, e)
         manager.disconnect(websocket, channel=channel)
 
 
@@ -112,27 +114,24 @@ async def websocket_dashboard(websocket: WebSocket):
             "timestamp": "2026-01-15T10:30:00Z"
         }
 
+        Events arriving in a burst are delivered together as
+        {"type": "batch", "items": [ ... messages as above ... ]}.
+
     Args:
         websocket: WebSocket connection
     """
-    await manager.connect(websocket, channel="dashboard")
+    await manager.connect(websocket, channel=DASHBOARD)
 
     try:
-        await manager.send_personal_message(
-            '{"type":"connected","message":"Connected to dashboard stream"}',
-            websocket
-        )
+        await manager.send_personal_message(CONNECTED_DASHBOARD, websocket)
 
         while True:
             data = await websocket.receive_text()
-            await manager.send_personal_message(
-                '{"type":"pong"}',
-                websocket
-            )
+            manager.send_pong(websocket)
 
     except WebSocketDisconnect:
-        manager.disconnect(websocket, channel="dashboard")
+        manager.disconnect(websocket, channel=DASHBOARD)
         logger.info("Client disconnected from dashboard stream")
     except Exception as e:
-        logger.error(f"WebSocket error in dashboard stream: {e}")
-        manager.disconnect(websocket, channel="dashboard")
+        logger.error("WebSocket error in dashboard stream: %s", e)
+        manager.disconnect(websocket, channel=DASHBOARD)
@@ -1,14 +1,92 @@
 """WebSocket connection manager with Redis pub/sub support."""
 
-import json
+import asyncio
 import logging
-from typing import Dict, List, Set
-
+import sys
+import time
+from collections import deque
+from datetime import datetime, timezone
+from typing import Deque, Dict, List, Optional, Set, Tuple
+
+import msgpack
+import orjson
+import zstandard
 from fastapi import WebSocket
 from redis.asyncio import Redis
+from redis.asyncio.cluster import ClusterPubSub, RedisCluster
+
+from app.config import settings
+from app.db.redis import get_redis
 
 logger = logging.getLogger(__name__)
 
+# Heartbeats arriving within this window get a single pong
+PONG_COALESCE_SECONDS = 0.005
+PONG_MESSAGE = '{"type":"pong"}'
+
+# Subprotocols a client can offer to receive broadcasts as binary frames:
+# plain MessagePack, or MessagePack behind a 1-byte header where 0x01 marks
+# a zstd-compressed body and 0x00 an uncompressed one
+MSGPACK_SUBPROTOCOL = "msgpack"
+MSGPACK_ZSTD_SUBPROTOCOL = "msgpack.zstd"
+BINARY_SUBPROTOCOLS = (MSGPACK_ZSTD_SUBPROTOCOL, MSGPACK_SUBPROTOCOL)
+
+# Frames larger than this are compressed for msgpack.zstd clients
+ZSTD_MIN_SIZE = 1024
+FRAME_RAW = b"\x00"
+FRAME_ZSTD = b"\x01"
+_zstd = zstandard.ZstdCompressor(level=3)
+
+# Broadcasts buffered per connection; beyond this they wait in an overflow
+# queue, and a connection whose overflow outlives SLOW_CONSUMER_SECONDS is
+# dropped as a slow consumer
+OUTBOX_SIZE = 256
+SLOW_CONSUMER_SECONDS = 1.0
+
+# Close code sent to evicted connections (1013: try again later)
+SLOW_CONSUMER_CLOSE_CODE = 1013
+
+# Seconds between sweeps that evict connections marked dead
+REAP_INTERVAL = 0.05
+
+# Pooled Redis connections held outside of publishes: the sharded pub/sub
+# subscription and the SHARDNUMSUB lookup made by the flusher
+REDIS_RESERVED_CONNECTIONS = 2
+
+# Redis publishes allowed in flight before flushes wait for one to finish. Each
+# holds a pooled connection, and the pool raises instead of waiting once it is
+# exhausted, so this stays below the pool size.
+MAX_PENDING_PUBLISHES = max(1, settings.redis_max_connections - REDIS_RESERVED_CONNECTIONS)
+
+# Seconds a cluster-wide subscriber count is trusted before re-checking
+SUBSCRIBER_COUNT_TTL = 1.0
+
+# WebSocket channel names; incident channels are interned as they are created
+ALERTS = sys.intern("alerts")
+INCIDENTS = sys.intern("incidents")
+DASHBOARD = sys.intern("dashboard")
+
+# Pre-encoded pieces of the event envelope
+# {"type": ..., "payload": ..., "timestamp": ...}, so each event is serialized
+# once and batches are assembled by joining bytes
+ALERT_CREATED_PREFIX = b'{"type":"alert_created","payload":'
+INCIDENT_UPDATED_PREFIX = b'{"type":"incident_updated","payload":'
+METRIC_UPDATE_PREFIX = b'{"type":"metric_update","payload":'
+TIMESTAMP_FIELD = b',"timestamp":'
+BATCH_PREFIX = b'{"type":"batch","items":['
+
+# Redis pub/sub channel for each batched WebSocket channel
+REDIS_CHANNELS = {
+    ALERTS: "soc:alerts",
+    INCIDENTS: "soc:incidents",
+    DASHBOARD: "soc:dashboard",
+}
+
+# WebSocket channel for each Redis channel, keyed by the raw bytes Redis returns
+REDIS_DISPATCH = {
+    redis_channel.encode(): channel for channel, redis_channel in REDIS_CHANNELS.items()
+}
+
 
 class WebSocketManager:
     """
@@ -17,33 +95,78 @@ class WebSocketManager:
     Supports both single-instance and distributed deployments via Redis pub/sub.
     """
 
-    def __init__(self):
-        """Initialize WebSocket manager."""
+    def __init__(self, batch_window_ms: int = 25, batch_max_messages: int = 64):
+        """
+        Initialize WebSocket manager.
+
+        Args:
+            batch_window_ms: How long events are buffered before a flush (0 disables batching)
+            batch_max_messages: Buffered events on one channel that force an early flush
+        """
         self.active_connections: Dict[str, Set[WebSocket]] = {
-            "alerts": set(),
-            "incidents": set(),
-            "dashboard": set(),
+            ALERTS: set(),
+            INCIDENTS: set(),
+            DASHBOARD: set(),
         }
         self.redis_client: Redis = None
+        self.redis_pub: Redis = None
         self.redis_pubsub = None
-
-    async def connect(self, websocket: WebSocket, channel: str = "alerts"):
+        # Immutable per-channel copies of active_connections, rebuilt only on
+        # connect/disconnect, so broadcasts iterate a plain tuple
+        self._snapshots: Dict[str, Tuple[WebSocket, ...]] = {
+            channel: () for channel in self.active_connections
+        }
+        self._pong_tasks: Dict[WebSocket, asyncio.Task] = {}
+        self._outboxes: Dict[WebSocket, asyncio.Queue] = {}
+        self._writers: Dict[WebSocket, asyncio.Task] = {}
+        self._overflows: Dict[WebSocket, Deque[dict]] = {}
+        self._backlogged: Dict[WebSocket, Tuple[str, float]] = {}
+        self._dead: Set[Tuple[WebSocket, str]] = set()
+        self._reaper: Optional[asyncio.Task] = None
+        self._binary_clients: Dict[WebSocket, str] = {}
+        self.batch_window = batch_window_ms / 1000
+        self.batch_max_messages = batch_max_messages
+        self._pending: Dict[str, List[bytes]] = {}
+        self._subscriber_counts: Dict[str, Tuple[float, int]] = {}
+        self._publish_tasks: Set[asyncio.Task] = set()
+        self._flush_task: Optional[asyncio.Task] = None
+        self._flush_now = asyncio.Event()
+
+    async def connect(self, websocket: WebSocket, channel: str = ALERTS):
         """
         Accept and register a new WebSocket connection.
 
+        Clients offering the "msgpack.zstd" or "msgpack" subprotocol receive
+        broadcasts as binary MessagePack frames; everyone else gets JSON text
+        frames.
+
         Args:
             websocket: WebSocket connection
             channel: Channel name (alerts, incidents, dashboard)
         """
-        await websocket.accept()
-
-        if channel not in self.active_connections:
-            self.active_connections[channel] = set()
-
-        self.active_connections[channel].add(websocket)
-        logger.info(f"WebSocket connected to channel '{channel}'. Total connections: {len(self.active_connections[channel])}")
-
-    def disconnect(self, websocket: WebSocket, channel: str = "alerts"):
+        offered = websocket.scope.get("subprotocols", ())
+        subprotocol = next((name for name in BINARY_SUBPROTOCOLS if name in offered), None)
+        if subprotocol:
+            await websocket.accept(subprotocol=subprotocol)
+            self._binary_clients[websocket] = subprotocol
+        else:
+            await websocket.accept()
+
+        channel = sys.intern(channel)
+
+        outbox = asyncio.Queue(maxsize=OUTBOX_SIZE)
+        self._outboxes[websocket] = outbox
+        self._writers[websocket] = asyncio.create_task(self._writer(websocket, channel, outbox))
+
+        connections = self.active_connections.setdefault(channel, set())
+        connections.add(websocket)
+        self._snapshots[channel] = tuple(connections)
+        logger.info(
+            "WebSocket connected to channel '%s'. Total connections: %d",
+            channel, len(connections)
+        )
+
+    def disconnect(self, websocket: WebSocket, channel: str = ALERTS):
         """
         Remove a WebSocket connection.
 
@@ -51,9 +174,104 @@ class WebSocketManager:
             websocket: WebSocket connection
             channel: Channel name
         """
+        pong_task = self._pong_tasks.pop(websocket, None)
+        if pong_task:
+            pong_task.cancel()
+
+        self._binary_clients.pop(websocket, None)
+        self._outboxes.pop(websocket, None)
+        self._overflows.pop(websocket, None)
+        self._backlogged.pop(websocket, None)
+        writer = self._writers.pop(websocket, None)
+        if writer:
+            writer.cancel()
+
         if channel in self.active_connections:
             self.active_connections[channel].discard(websocket)
-            logger.info(f"WebSocket disconnected from channel '{channel}'. Remaining connections: {len(self.active_connections[channel])}")
+            self._snapshots[channel] = tuple(self.active_connections[channel])
+            logger.info(
+                "WebSocket disconnected from channel '%s'. Remaining connections: %d",
+                channel, len(self.active_connections[channel])
+            )
+
+    async def _writer(self, websocket: WebSocket, channel: str, outbox: asyncio.Queue):
+        """
+        Drain a connection's outbox, one message at a time.
+
+        Each connection has its own writer, so a slow client only backs up
+        its own bounded queue instead of stalling the broadcaster. Queued
+        items are ready-made ASGI send messages shared by every recipient.
+        Every slot freed in the outbox is refilled from the connection's
+        overflow before sending, so frames keep their order.
+        """
+        try:
+            while True:
+                message = await outbox.get()
+                overflow = self._overflows.get(websocket)
+                if overflow:
+                    outbox.put_nowait(overflow.popleft())
+                    if not overflow:
+                        del self._overflows[websocket]
+                        self._backlogged.pop(websocket, None)
+                await websocket.send(message)
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.error("Error broadcasting to WebSocket: %s", e)
+            self._mark_dead(websocket, channel)
+
+    def _mark_dead(self, websocket: WebSocket, channel: str):
+        """
+        Queue a failed connection for eviction.
+
+        Eviction happens in a background sweep, so the broadcast loop never
+        mutates connection sets or allocates cleanup state itself.
+        """
+        self._dead.add((websocket, channel))
+        self._schedule_reaper()
+
+    def _mark_backlogged(self, websocket: WebSocket, channel: str):
+        """
+        Note that a connection's outbox has overflowed.
+
+        A full outbox on its own only means the writer has not run yet; the
+        sweep evicts the connection once the overflow has lasted
+        SLOW_CONSUMER_SECONDS.
+        """
+        self._backlogged.setdefault(websocket, (channel, time.monotonic()))
+        self._schedule_reaper()
+
+    def _schedule_reaper(self):
+        if self._reaper is None:
+            self._reaper = asyncio.create_task(self._reap_dead())
+
+    async def _reap_dead(self):
+        """Evict failed and persistently slow connections, then ask the clients to reconnect."""
+        await asyncio.sleep(REAP_INTERVAL)
+        self._reaper = None
+        dead, self._dead = self._dead, set()
+
+        now = time.monotonic()
+        catching_up = False
+        for websocket, (channel, since) in self._backlogged.items():
+            if now - since >= SLOW_CONSUMER_SECONDS:
+                dead.add((websocket, channel))
+            else:
+                catching_up = True
+        if catching_up:
+            # Still within their grace period; look again on the next sweep
+            self._schedule_reaper()
+        if not dead:
+            return
+
+        logger.warning("Evicting %d failed or slow WebSocket connection(s)", len(dead))
+        for websocket, channel in dead:
+            self.disconnect(websocket, channel)
+
+        await asyncio.gather(
+            *(websocket.close(code=SLOW_CONSUMER_CLOSE_CODE) for websocket, _ in dead),
+            return_exceptions=True
+        )
 
     async def send_personal_message(self, message: str, websocket: WebSocket):
         """
@@ -66,9 +284,33 @@ class WebSocketManager:
         try:
             await websocket.send_text(message)
         except Exception as e:
-            logger.error(f"Error sending personal message: {e}")
+            logger.error("Error sending personal message: %s", e)
+
+    def send_pong(self, websocket: WebSocket):
+        """
+        Schedule a heartbeat reply to a WebSocket connection.
 
-    async def broadcast(self, message: dict, channel: str = "alerts"):
+        A burst of heartbeats from one client is answered with a single pong
+        sent a few milliseconds later, instead of one write per message.
+
+        Args:
+            websocket: Target WebSocket connection
+        """
+        if websocket in self._pong_tasks:
+            return
+
+        self._pong_tasks[websocket] = asyncio.create_task(self._flush_pong(websocket))
+
+    async def _flush_pong(self, websocket: WebSocket):
+        """Send the coalesced pong for a connection."""
+        try:
+            await asyncio.sleep(PONG_COALESCE_SECONDS)
+        finally:
+            self._pong_tasks.pop(websocket, None)
+
+        await self.send_personal_message(PONG_MESSAGE, websocket)
+
+    async def broadcast(self, message: dict, channel: str = ALERTS):
         """
         Broadcast a message to all connections in a channel.
 
@@ -76,23 +318,269 @@ class WebSocketManager:
             message: Message dictionary to broadcast
             channel: Channel name
         """
+        await self._broadcast_raw(orjson.dumps(message), channel)
+
+    async def _broadcast_raw(self, payload: bytes, channel: str):
+        """
+        Broadcast an already serialized JSON message to a channel.
+
+        Args:
+            payload: Serialized message
+            channel: Channel name
+        """
         if channel not in self.active_connections:
-            logger.warning(f"Channel '{channel}' not found")
+            logger.warning("Channel '%s' not found", channel)
+            return
+
+        if not self._snapshots[channel]:
             return
 
-        message_text = json.dumps(message)
-        disconnected = set()
+        # Each wire format is encoded (and compressed) at most once per
+        # broadcast, however many clients use it
+        frames: Dict[Optional[str], dict] = {}
 
-        for connection in self.active_connections[channel]:
+        for connection in self._snapshots[channel]:
+            outbox = self._outboxes.get(connection)
+            if outbox is None:
+                continue
+            overflow = self._overflows.get(connection)
+
+            subprotocol = self._binary_clients.get(connection)
+            frame = frames.get(subprotocol)
+            if frame is None:
+                frame = frames[subprotocol] = self._encode_frame(payload, subprotocol, frames)
+
+            if overflow is not None:
+                overflow.append(frame)
+                continue
             try:
-                await connection.send_text(message_text)
+                outbox.put_nowait(frame)
+            except asyncio.QueueFull:
+                self._overflows[connection] = deque((frame,))
+                self._mark_backlogged(connection, channel)
+
+    @staticmethod
+    def _encode_frame(
+        payload: bytes,
+        subprotocol: Optional[str],
+        frames: Dict[Optional[str], dict]
+    ) -> dict:
+        """
+        Build the ASGI send message for a connection's wire format.
+
+        The message is built once per broadcast and handed to every
+        connection using that format.
+
+        Args:
+            payload: Serialized JSON message
+            subprotocol: Negotiated binary subprotocol, or None for JSON text
+            frames: Messages already built for this broadcast
+        """
+        if subprotocol is None:
+            return {"type": "websocket.send", "text": payload.decode()}
+
+        packed_message = frames.get(MSGPACK_SUBPROTOCOL)
+        if packed_message is None:
+            packed_message = frames[MSGPACK_SUBPROTOCOL] = {
+                "type": "websocket.send",
+                "bytes": msgpack.packb(orjson.loads(payload)),
+            }
+        if subprotocol == MSGPACK_SUBPROTOCOL:
+            return packed_message
+
+        packed = packed_message["bytes"]
+        if len(packed) > ZSTD_MIN_SIZE:
+            return {"type": "websocket.send", "bytes": FRAME_ZSTD + _zstd.compress(packed)}
+        return {"type": "websocket.send", "bytes": FRAME_RAW + packed}
+
+    async def _channels_with_remote_subscribers(self, redis_channels: List[str]) -> Set[str]:
+        """
+        Return the Redis channels some other instance is subscribed to.
+
+        Counts come from PUBSUB SHARDNUMSUB (on a cluster, asked of the node
+        owning each channel's slot) and are cached for SUBSCRIBER_COUNT_TTL
+        seconds; this instance's own subscription is not counted. If the
+        counts cannot be fetched, every channel is assumed to have subscribers.
+
+        Args:
+            redis_channels: Redis channel names
+        """
+        if not self.redis_client or not redis_channels:
+            return set()
+
+        now = time.monotonic()
+        stale = [
+            channel for channel in redis_channels
+            if now - self._subscriber_counts.get(channel, (float("-inf"), 0))[0] > SUBSCRIBER_COUNT_TTL
+        ]
+        if stale:
+            try:
+                for channel, count in await self._shard_subscriber_counts(stale):
+                    self._subscriber_counts[channel.decode()] = (now, count)
             except Exception as e:
-                logger.error(f"Error broadcasting to WebSocket: {e}")
-                disconnected.add(connection)
+                logger.error("Error counting Redis subscribers: %s", e)
+                return set(redis_channels)
 
-        # Clean up disconnected connections
-        for connection in disconnected:
-            self.active_connections[channel].discard(connection)
+        own = 1 if self.redis_pubsub is not None and self.redis_pubsub.subscribed else 0
+        return {
+            channel for channel in redis_channels
+            if self._subscriber_counts.get(channel, (now, 1))[1] > own
+        }
+
+    async def _shard_subscriber_counts(self, redis_channels: List[str]) -> List[Tuple[bytes, int]]:
+        """(channel, subscriber count) pairs from PUBSUB SHARDNUMSUB."""
+        if not isinstance(self.redis_client, RedisCluster):
+            return await self.redis_client.pubsub_shardnumsub(*redis_channels)
+
+        # Shard channel subscribers are connected to the node owning the
+        # channel's slot, which is the only node that can count them
+        by_node = {}
+        for redis_channel in redis_channels:
+            node = self.redis_client.get_node_from_key(redis_channel)
+            by_node.setdefault(node.name, (node, []))[1].append(redis_channel)
+
+        replies = await asyncio.gather(*(
+            self.redis_client.pubsub_shardnumsub(*node_channels, target_nodes=node)
+            for node, node_channels in by_node.values()
+        ))
+        return [pair for reply in replies for pair in reply]
+
+    async def publish_many(self, items: List[Tuple[str, bytes]]):
+        """
+        Publish serialized messages to Redis for distributed instances.
+
+        All publishes go out in one non-transactional pipeline, so they cost
+        a single round-trip.
+
+        Args:
+            items: (Redis channel name, serialized message) pairs
+        """
+        if not self.redis_pub or not items:
+            return
+
+        try:
+            async with self.redis_pub.pipeline(transaction=False) as pipe:
+                for redis_channel, payload in items:
+                    pipe.spublish(redis_channel, payload)
+                await pipe.execute()
+        except Exception as e:
+            logger.error("Error publishing to Redis: %s", e)
+
+    async def _queue_event(self, channel: str, message: bytes):
+        """
+        Buffer an event for the next flush of its channel.
+
+        Events are flushed batch_window after the first one arrives, or as
+        soon as a channel has batch_max_messages waiting, so a burst costs one
+        frame per client and one Redis publish per channel instead of one per
+        event.
+
+        Args:
+            channel: WebSocket channel name
+            message: Serialized event envelope
+        """
+        if self.batch_window <= 0:
+            self._pending.setdefault(channel, []).append(message)
+            await self._flush_pending()
+            return
+
+        pending = self._pending.setdefault(channel, [])
+        pending.append(message)
+        if len(pending) >= self.batch_max_messages:
+            self._flush_now.set()
+
+        if self._flush_task is None:
+            self._flush_task = asyncio.create_task(self._flush_after_window())
+
+    async def _flush_after_window(self):
+        """
+        Wait out the batching window (or an early flush), then flush.
+
+        Events queued while a flush is in progress are picked up by the next
+        pass, so there is only ever one flusher and a channel's batches go out
+        in order. _flush_task stays set until nothing is left, which lets
+        close_redis wait for the last publish.
+        """
+        try:
+            while self._pending:
+                try:
+                    await asyncio.wait_for(self._flush_now.wait(), timeout=self.batch_window)
+                except asyncio.TimeoutError:
+                    pass
+                self._flush_now.clear()
+                await self._flush_pending()
+        finally:
+            self._flush_task = None
+
+    async def _flush_pending(self):
+        """
+        Send every buffered event, one frame per channel.
+
+        A lone event is sent as-is; several are wrapped in
+        {"type": "batch", "items": [...]}, at most batch_max_messages each.
+        """
+        pending, self._pending = self._pending, {}
+        publishes = []
+        remote = await self._channels_with_remote_subscribers(
+            [REDIS_CHANNELS[channel] for channel in pending]
+        )
+
+        for channel, messages in pending.items():
+            redis_channel = REDIS_CHANNELS[channel]
+            has_local = bool(self._snapshots.get(channel))
+            has_remote = redis_channel in remote
+            if not has_local and not has_remote:
+                continue
+
+            for start in range(0, len(messages), self.batch_max_messages):
+                batch = messages[start:start + self.batch_max_messages]
+                if len(batch) == 1:
+                    payload = batch[0]
+                else:
+                    payload = BATCH_PREFIX + b",".join(batch) + b"]}"
+
+                if has_local:
+                    await self._broadcast_raw(payload, channel)
+                    # Let the writers drain before queueing the next batch
+                    await asyncio.sleep(0)
+                if has_remote:
+                    publishes.append((redis_channel, payload))
+
+        if publishes:
+            await self._publish_in_background(publishes)
+
+    async def _publish_in_background(self, items: List[Tuple[str, bytes]]):
+        """
+        Start a Redis publish without waiting for its round-trip.
+
+        At most MAX_PENDING_PUBLISHES run at once; beyond that the caller
+        waits for one to finish, so a stalled Redis applies backpressure
+        instead of piling up tasks. Errors are logged by publish_many.
+
+        Args:
+            items: (Redis channel name, serialized message) pairs
+        """
+        if len(self._publish_tasks) >= MAX_PENDING_PUBLISHES:
+            await asyncio.wait(self._publish_tasks, return_when=asyncio.FIRST_COMPLETED)
+
+        task = asyncio.create_task(self.publish_many(items))
+        self._publish_tasks.add(task)
+        task.add_done_callback(self._publish_tasks.discard)
+
+    @staticmethod
+    def _encode_event(prefix: bytes, payload: dict, timestamp: Optional[str]) -> bytes:
+        """
+        Serialize an event envelope from its pre-encoded type prefix.
+
+        Args:
+            prefix: Envelope start up to the payload, e.g. ALERT_CREATED_PREFIX
+            payload: Event data
+            timestamp: Event timestamp (ISO 8601)
+
+        Returns:
+            The envelope as JSON bytes
+        """
+        return prefix + orjson.dumps(payload) + TIMESTAMP_FIELD + orjson.dumps(timestamp) + b"}"
 
     async def broadcast_alert(self, alert_data: dict):
         """
@@ -101,22 +589,9 @@ class WebSocketManager:
         Args:
             alert_data: Alert data dictionary
         """
-        message = {
-            "type": "alert_created",
-            "payload": alert_data,
-            "timestamp": alert_data.get("created_at")
-        }
-        await self.broadcast(message, channel="alerts")
-
-        # Also publish to Redis for distributed instances
-        if self.redis_client:
-            try:
-                await self.redis_client.publish(
-                    "soc:alerts",
-                    json.dumps(message)
-                )
-            except Exception as e:
-                logger.error(f"Error publishing to Redis: {e}")
+        await self._queue_event(ALERTS, self._encode_event(
+            ALERT_CREATED_PREFIX, alert_data, alert_data.get("created_at")
+        ))
 
     async def broadcast_incident(self, incident_data: dict):
         """
@@ -125,22 +600,9 @@ class WebSocketManager:
         Args:
             incident_data: Incident data dictionary
         """
-        message = {
-            "type": "incident_updated",
-            "payload": incident_data,
-            "timestamp": incident_data.get("updated_at")
-        }
-        await self.broadcast(message, channel="incidents")
-
-        # Publish to Redis
-        if self.redis_client:
-            try:
-                await self.redis_client.publish(
-                    "soc:incidents",
-                    json.dumps(message)
-                )
-            except Exception as e:
-                logger.error(f"Error publishing to Redis: {e}")
+        await self._queue_event(INCIDENTS, self._encode_event(
+            INCIDENT_UPDATED_PREFIX, incident_data, incident_data.get("updated_at")
+        ))
 
     async def broadcast_metric_update(self, metrics: dict):
         """
@@ -149,38 +611,20 @@ class WebSocketManager:
         Args:
             metrics: Metrics data dictionary
         """
-        from datetime import datetime
-
-        message = {
-            "type": "metric_update",
-            "payload": metrics,
-            "timestamp": datetime.utcnow().isoformat()
-        }
-        await self.broadcast(message, channel="dashboard")
-
-        # Publish to Redis
-        if self.redis_client:
-            try:
-                await self.redis_client.publish(
-                    "soc:dashboard",
-                    json.dumps(message)
-                )
-            except Exception as e:
-                logger.error(f"Error publishing to Redis: {e}")
+        await self._queue_event(DASHBOARD, self._encode_event(
+            METRIC_UPDATE_PREFIX, metrics, datetime.now(timezone.utc).isoformat()
+        ))
 
-    async def setup_redis(self, redis_url: str):
+    async def setup_redis(self):
         """
-        Set up Redis connection for pub/sub.
+        Set up Redis clients for pub/sub (see get_redis for cluster mode).
 
-        Args:
-            redis_url: Redis connection URL
+        Publishing goes through its own client so it never queues behind
+        the subscriber; payloads stay bytes, which orjson parses directly.
         """
         try:
-            self.redis_client = Redis.from_url(
-                redis_url,
-                encoding="utf-8",
-                decode_responses=True
-            )
+            self.redis_client = get_redis()
+            self.redis_pub = get_redis()
 
             # Test connection
             await self.redis_client.ping()
@@ -190,8 +634,9 @@ class WebSocketManager:
             await self._subscribe_to_redis()
 
         except Exception as e:
-            logger.error(f"❌ Failed to connect to Redis: {e}")
+            logger.error("❌ Failed to connect to Redis: %s", e)
             self.redis_client = None
+            self.redis_pub = None
 
     async def _subscribe_to_redis(self):
         """Subscribe to Redis pub/sub channels for distributed broadcasting."""
@@ -200,7 +645,7 @@ class WebSocketManager:
 
         try:
             self.redis_pubsub = self.redis_client.pubsub()
-            await self.redis_pubsub.subscribe(
+            await self.redis_pubsub.ssubscribe(
                 "soc:alerts",
                 "soc:incidents",
                 "soc:dashboard"
@@ -209,7 +654,7 @@ class WebSocketManager:
             logger.info("✅ Subscribed to Redis pub/sub channels")
 
         except Exception as e:
-            logger.error(f"❌ Failed to subscribe to Redis: {e}")
+            logger.error("❌ Failed to subscribe to Redis: %s", e)
 
     async def listen_to_redis(self):
         """
@@ -222,38 +667,64 @@ class WebSocketManager:
 
         logger.info("🎧 Listening for Redis pub/sub messages...")
 
-        async for message in self.redis_pubsub.listen():
-            if message["type"] != "message":
+        # On a cluster each shard channel is read from its own node's connection
+        if isinstance(self.redis_pubsub, ClusterPubSub):
+            get_message = self.redis_pubsub.get_sharded_message
+        else:
+            get_message = self.redis_pubsub.get_message
+
+        while self.redis_pubsub.subscribed:
+            message = await get_message(
+                ignore_subscribe_messages=True,
+                timeout=1.0
+            )
+            if message is None:
                 continue
 
-            try:
-                channel = message["channel"]
-                data = json.loads(message["data"])
+            # Drain whatever else has already arrived before waiting again
+            burst = [message]
+            while True:
+                message = await get_message(
+                    ignore_subscribe_messages=True,
+                    timeout=0
+                )
+                if message is None:
+                    break
+                burst.append(message)
 
-                # Map Redis channels to WebSocket channels
-                channel_map = {
-                    "soc:alerts": "alerts",
-                    "soc:incidents": "incidents",
-                    "soc:dashboard": "dashboard"
-                }
+            for message in burst:
+                try:
+                    # Payloads are already serialized JSON frames; relay them as-is
+                    ws_channel = REDIS_DISPATCH.get(message["channel"])
+                    if ws_channel:
+                        await self._broadcast_raw(message["data"], ws_channel)
 
-                ws_channel = channel_map.get(channel)
-                if ws_channel:
-                    await self.broadcast(data, channel=ws_channel)
+                except Exception as e:
+                    logger.error("Error processing Redis message: %s", e)
 
-            except Exception as e:
-                logger.error(f"Error processing Redis message: {e}")
+                # Let the writers drain before relaying the next frame
+                await asyncio.sleep(0)
 
     async def close_redis(self):
         """Close Redis connections."""
+        # Deliver anything still buffered before the client goes away
+        if self._flush_task:
+            self._flush_now.set()
+            await self._flush_task
+        if self._publish_tasks:
+            await asyncio.gather(*self._publish_tasks)
+
         if self.redis_pubsub:
-            await self.redis_pubsub.unsubscribe()
-            await self.redis_pubsub.close()
+            await self.redis_pubsub.sunsubscribe()
+            await self.redis_pubsub.aclose()
 
-        if self.redis_client:
-            await self.redis_client.close()
+        # Standalone connections go back to the shared pool, which is closed on
+        # shutdown; cluster clients close their own node connections here
+        for client in (self.redis_client, self.redis_pub):
+            if client:
+                await client.aclose()
 
-        logger.info("Redis connections closed")
+        logger.info("Redis pub/sub clients closed")
 
     def get_connection_stats(self) -> dict:
         """
@@ -269,4 +740,7 @@ class WebSocketManager:
 
 
 # Global WebSocket manager instance
-manager = WebSocketManager()
+manager = WebSocketManager(
+    batch_window_ms=settings.ws_batch_window_ms,
+    batch_max_messages=settings.ws_batch_max_messages
+)